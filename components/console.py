@@ -173,6 +173,20 @@ class OutputConsole(ctk.CTkFrame):
         except Exception as e:
             self.add_output(f"Failed to copy to clipboard: {str(e)}", LogLevel.ERROR)
 
+    def get_message_colors(self):
+        """Get the message color for each log level in the current theme"""
+        dark = bool(self.state_manager) and self.state_manager.get('theme') == 'dark'
+
+        # Simple color map without tuples
+        return {
+            "debug": "#999999" if dark else "#666666",
+            "info": "#e0e0e0" if dark else "#333333",
+            "success": "#4CAF50",
+            "warning": "#FF9800",
+            "error": "#f44336",
+            "system": "#2196F3"
+        }
+
     def add_output(self, message: str, msg_type: str = "info", force_display: bool = False):
         """Add a message to the output console with timestamp and filtering"""
         try:
@@ -213,15 +227,7 @@ class OutputConsole(ctk.CTkFrame):
             line_start = self.output_text.index("end-2l linestart")
             line_end = self.output_text.index("end-1c")
 
-            # Simple color map without tuples
-            colors = {
-                "debug": "#999999" if self.state_manager and self.state_manager.get('theme') == 'dark' else "#666666",
-                "info": "#e0e0e0" if self.state_manager and self.state_manager.get('theme') == 'dark' else "#333333",
-                "success": "#4CAF50",
-                "warning": "#FF9800",
-                "error": "#f44336",
-                "system": "#2196F3"
-            }
+            colors = self.get_message_colors()
 
             if msg_type in colors:
                 # Find where the actual message starts (after timestamp and any prefix)
@@ -253,6 +259,60 @@ class OutputConsole(ctk.CTkFrame):
             except:
                 pass
 
+    def add_outputs(self, messages):
+        """Add a batch of (msg_type, message) pairs from the script runner
+
+        Lines look the same as with add_output, but the textbox is unlocked,
+        scrolled and locked again once per batch, and each line is a single
+        insert of (text, tag) pairs instead of being tagged by index afterwards.
+        """
+        lines = None
+        written = 0
+        try:
+            filtered = []
+            for msg_type, message in messages:
+                msg_type = str(msg_type).lower()
+                if msg_type == "debug" and not self.developer_mode:
+                    continue
+                filtered.append((msg_type, message))
+            lines = filtered
+
+            if not lines:
+                return
+
+            timestamp = f"[{datetime.now().strftime('%H:%M:%S')}]"
+            colors = self.get_message_colors()
+            prefixes = {"debug": "[DEBUG] ", "warning": "[WARN] ", "error": "[ERROR] "} if self.developer_mode else {}
+
+            self.output_text.tag_config("timestamp", foreground="gray")
+            self.output_text.tag_config("debug_prefix", foreground="#999999")
+            for msg_type in {msg_type for msg_type, _ in lines if msg_type in colors}:
+                self.output_text.tag_config(f"msg_{msg_type}", foreground=colors[msg_type])
+
+            # CTkTextbox.insert only takes one (text, tags) pair; the underlying
+            # tk Text widget takes any number of them in one call
+            text_widget = getattr(self.output_text, '_textbox', self.output_text)
+
+            self.output_text.configure(state="normal")
+            for msg_type, message in lines:
+                if msg_type == "debug" and self.developer_mode:
+                    prefix = (" ", "", prefixes[msg_type], "debug_prefix")
+                else:
+                    prefix = (f" {prefixes.get(msg_type, '')}", "")
+                text_widget.insert("end", timestamp, "timestamp", *prefix,
+                                   f"{message}\n", f"msg_{msg_type}" if msg_type in colors else "")
+                written += 1
+
+            # Auto-scroll to bottom
+            self.output_text.see("end")
+            self.output_text.configure(state="disabled")
+
+        except Exception as e:
+            print(f"Console error: {e} - Batch of {len(messages)} messages")
+            # Fallback - add the messages not yet written one at a time
+            for msg_type, message in (messages if lines is None else lines[written:]):
+                self.add_output(message, msg_type)
+
     def clear(self):
         """Clear all output from the console"""
         self.output_text.configure(state="normal")
@@ -28,8 +28,11 @@ CONTROL_BUTTON_HEIGHT = 40
 
 # Timing
 OUTPUT_CHECK_INTERVAL = 100  # milliseconds
+OUTPUT_CHECK_MIN_INTERVAL = 20  # milliseconds, while a script is producing output
+OUTPUT_CHECK_MAX_INTERVAL = 500  # milliseconds, after the script has gone quiet
 SCRIPT_SIMULATION_DELAY = 1  # seconds
 STATUS_RESET_DELAY = 10000  # milliseconds (5 seconds) # Add this line
+SEARCH_DEBOUNCE_DELAY = 150  # milliseconds
 
 # Script simulation data
 SIMULATION_OPERATIONS = [
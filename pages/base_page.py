@@ -27,6 +27,9 @@ class BasePage(ctk.CTkFrame):
         self.page_name = self.__class__.__name__.replace('Page', '')
         self.is_active = False
 
+        # Mouse wheel handler from the last configure_scroll_speed call
+        self._mousewheel_handler = None
+
         # Configure the frame
         self.configure(fg_color="transparent")
         self.grid_columnconfigure(0, weight=1)
@@ -88,32 +91,46 @@ class BasePage(ctk.CTkFrame):
             # Scroll the canvas
             scrollable_frame._parent_canvas.yview_scroll(int(delta), "units")
 
-        # Bind mouse wheel events to the scrollable frame and its canvas
-        def bind_scroll_events(widget):
-            # Windows and MacOS
-            widget.bind("<MouseWheel>", _on_mousewheel)
-            # Linux
-            widget.bind("<Button-4>", _on_mousewheel)
-            widget.bind("<Button-5>", _on_mousewheel)
+        # Remembered so widgets created later can get the same binding
+        self._mousewheel_handler = _on_mousewheel
 
         # Apply to the scrollable frame itself
-        bind_scroll_events(scrollable_frame)
+        self.bind_scroll_events(scrollable_frame, _on_mousewheel)
 
         # Apply to the internal canvas if accessible
         if hasattr(scrollable_frame, '_parent_canvas'):
-            bind_scroll_events(scrollable_frame._parent_canvas)
-
-        # Apply to all child widgets recursively
-        def bind_to_children(widget):
-            bind_scroll_events(widget)
-            for child in widget.winfo_children():
-                try:
-                    bind_to_children(child)
-                except:
-                    pass  # Skip if widget doesn't support binding
-
-        # Bind after a short delay to ensure all children are created
-        scrollable_frame.after(100, lambda: bind_to_children(scrollable_frame))
+            self.bind_scroll_events(scrollable_frame._parent_canvas, _on_mousewheel)
+
+        # Apply to all child widgets again after a short delay to ensure all
+        # children are created
+        scrollable_frame.after(100, lambda: self.bind_scroll_events(scrollable_frame, _on_mousewheel))
+
+    def bind_scroll_events(self, widget, handler=None):
+        """Bind fast mouse wheel scrolling to a widget and all its children
+
+        Children are only bound once, shortly after configure_scroll_speed, so
+        widgets created later (e.g. lazily built cards) must be passed here.
+
+        Args:
+            widget: The widget to bind
+            handler: Mouse wheel handler, defaults to the one from the last
+                configure_scroll_speed call
+        """
+        handler = handler or self._mousewheel_handler
+        if handler is None:
+            return
+
+        try:
+            # Windows and MacOS
+            widget.bind("<MouseWheel>", handler)
+            # Linux
+            widget.bind("<Button-4>", handler)
+            widget.bind("<Button-5>", handler)
+        except Exception:
+            return  # Skip if widget doesn't support binding
+
+        for child in widget.winfo_children():
+            self.bind_scroll_events(child, handler)
 
     # Rest of the BasePage methods remain the same...
     def setup_ui(self):
@@ -128,7 +128,7 @@ class ProcessPage(BasePage):
         self.control_panel.grid(row=2, column=0, padx=20, pady=(10, 20), sticky="ew")
 
         # Set up output handling
-        self.output_manager.set_output_callback(self.console.add_output)
+        self.output_manager.set_output_callback(self.console.add_output, self.console.add_outputs)
 
     def continue_script(self):
         """Continue a paused script"""
@@ -1,5 +1,7 @@
 """Settings page - application configuration (CLEANED VERSION)"""
 
+from collections.abc import Mapping
+
 import customtkinter as ctk
 from pages.base_page import BasePage
 from config.settings import MIN_FONT_SIZE, MAX_FONT_SIZE, FONT_SIZE_STEPS
@@ -7,6 +9,22 @@ from services.sound_manager import get_sound_manager
 from services.notification_manager import get_notification_manager
 
 
+class _VarView(Mapping):
+    """Read-only mapping view that resolves Tk variables on access"""
+
+    def __init__(self, vars_):
+        self._vars = vars_
+
+    def __getitem__(self, key):
+        return self._vars[key].get()
+
+    def __iter__(self):
+        return iter(self._vars)
+
+    def __len__(self):
+        return len(self._vars)
+
+
 class SettingsPage(BasePage):
     """Settings page for application configuration"""
 
@@ -65,6 +83,10 @@ class SettingsPage(BasePage):
         )
         self.create_execution_settings(execution_section.content_frame)
 
+        # Bind every persisted setting key to its variable once
+        self.setting_vars = self._build_setting_vars()
+        self._settings_view = _VarView(self.setting_vars)
+
         # Save/Reset buttons (updated row number since Advanced section was removed)
         button_frame = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
         button_frame.grid(row=6, column=0, pady=(30, 0), sticky="ew")
@@ -85,6 +107,35 @@ class SettingsPage(BasePage):
         )
         reset_btn.grid(row=0, column=2, padx=5)
 
+    def _build_setting_vars(self) -> dict:
+        """Map each persisted setting key to the variable holding its value"""
+        setting_vars = {
+            'theme': self.theme_var,
+            'font_size': self.font_size_var,
+            'auto_scroll': self.auto_scroll_var,
+            'clear_on_run': self.clear_on_run_var,
+            'developer_mode': self.developer_mode_var,
+            # Sound settings
+            'sounds_enabled': self.sounds_enabled_var,
+            'sound_volume': self.volume_var,
+            # Notification settings
+            'notifications_enabled': self.notifications_enabled_var,
+            'notification_duration': self.duration_var,
+            'silent_notifications': self.silent_notifications_var,
+        }
+
+        # Add individual sound type settings with correct keys
+        for sound_key, var in self.sound_type_vars.items():
+            # Add the 'sound_' prefix to match what the integration expects
+            setting_vars[f'sound_{sound_key}'] = var
+
+        # Add individual notification type settings with correct keys
+        for notif_key, var in self.notification_type_vars.items():
+            # Add the 'notification_' prefix to match what the integration expects
+            setting_vars[f'notification_{notif_key}'] = var
+
+        return setting_vars
+
     def on_developer_mode_changed(self):
         """Handle developer mode toggle in settings"""
         developer_mode = self.developer_mode_var.get()
@@ -504,31 +555,8 @@ class SettingsPage(BasePage):
 
     def save_settings(self):
         """Save current settings with correct key naming"""
-        # Gather all settings
-        settings = {
-            'theme': self.theme_var.get(),
-            'font_size': self.font_size_var.get(),
-            'auto_scroll': self.auto_scroll_var.get(),
-            'clear_on_run': self.clear_on_run_var.get(),
-            'developer_mode': self.developer_mode_var.get(),
-            # Sound settings
-            'sounds_enabled': self.sounds_enabled_var.get(),
-            'sound_volume': self.volume_var.get(),
-            # Notification settings
-            'notifications_enabled': self.notifications_enabled_var.get(),
-            'notification_duration': self.duration_var.get(),
-            'silent_notifications': self.silent_notifications_var.get(),  # NEW
-        }
-
-        # Add individual sound type settings with correct keys
-        for sound_key, var in self.sound_type_vars.items():
-            # Add the 'sound_' prefix to match what the integration expects
-            settings[f'sound_{sound_key}'] = var.get()
-
-        # Add individual notification type settings with correct keys
-        for notif_key, var in self.notification_type_vars.items():
-            # Add the 'notification_' prefix to match what the integration expects
-            settings[f'notification_{notif_key}'] = var.get()
+        # Gather all settings from the bound variable view
+        settings = dict(self._settings_view)
 
         # Update state
         self.state_manager.update(settings)
@@ -4,7 +4,71 @@ import customtkinter as ctk
 from pages.base_page import BasePage
 from typing import List, Dict, Any
 import webbrowser
+from collections import defaultdict
+from functools import partial
 from config.sops_config import SOPS_DATA, SOP_CATEGORIES, DIFFICULTY_LEVELS
+from config.settings import SEARCH_DEBOUNCE_DELAY, WINDOW_SIZE
+
+# Font specs shared by every SOP card; the CTkFont objects are built once
+_FONT_SPECS = {
+    'header': {'size': 24, 'weight': "bold"},
+    'icon': {'size': 24},
+    'empty_title': {'size': 18, 'weight': "bold"},
+    'title': {'size': 16, 'weight': "bold"},
+    'search_icon': {'size': 16},
+    'body': {'size': 14},
+    'label_bold': {'size': 12, 'weight': "bold"},
+    'desc': {'size': 12},
+    'badge': {'size': 11},
+    'tag': {'size': 10},
+}
+_FONTS = None
+
+# Fixed card row height: the card plus its 10px grid padding above and below.
+# Cards never grow past it, so every row has the same height while scrolling
+_CARD_ROW_HEIGHT = 260
+_CARD_PADY = 10
+# Extra rows rendered above and below the viewport to hide pop-in while scrolling
+_OVERSCAN_ROWS = 1
+
+# Card border colors (light, dark)
+_CARD_BORDER_COLOR = ("gray70", "gray30")
+_CARD_HIGHLIGHT_COLOR = ("#1f6aa5", "#1f6aa5")
+_HIGHLIGHT_DURATION = 1500  # milliseconds
+
+# Card grid: badge columns plus a trailing filler column, and the title's
+# left offset that leaves room for the icon sharing its cell
+_CARD_COLUMNS = 4
+_ICON_GUTTER = 40
+
+# Longest badge text shown before truncating (badges don't wrap)
+_BADGE_MAX_CHARS = 18
+# Longest title and description shown before truncating, so the wrapped text
+# fits the fixed card height (anything taller is clipped)
+_TITLE_MAX_CHARS = 60
+_DESC_MAX_CHARS = 120
+
+# Badge colors per difficulty level (light, dark)
+_DIFFICULTY_COLORS = {
+    'Beginner': ("#4CAF50", "#2d5a2f"),
+    'Intermediate': ("#FF9800", "#b36a00"),
+    'Advanced': ("#f44336", "#961f17")
+}
+
+
+def _get_fonts() -> Dict[str, ctk.CTkFont]:
+    """Create the shared SOP page fonts on first use (requires a Tk root)"""
+    global _FONTS
+    if _FONTS is None:
+        _FONTS = {name: ctk.CTkFont(**spec) for name, spec in _FONT_SPECS.items()}
+    return _FONTS
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """Shorten text to max_chars, ending in an ellipsis when cut"""
+    if len(text) > max_chars:
+        return text[:max_chars - 1] + "…"
+    return text
 
 
 class SOPsPage(BasePage):
@@ -12,7 +76,8 @@ class SOPsPage(BasePage):
 
     def __init__(self, parent, state_manager, event_bus, **kwargs):
         # Define SOPs data structure - Easy to extend by adding new entries
-        self.sops_data = SOPS_DATA
+        # Copy the configured list so add/remove never mutate the shared config
+        self.sops_data = list(SOPS_DATA)
         # self.sops_data = [
         #     {
         #         'id': 'data_processing',
@@ -82,18 +147,42 @@ class SOPsPage(BasePage):
         #     }
         # ]
 
+        # Precompute the lowercased search text for each SOP
+        for sop in self.sops_data:
+            self._index_sop(sop)
+
         # Initialize categories for filtering
-        self.categories = list(set(sop['category'] for sop in self.sops_data))
+        self.categories = list(dict.fromkeys(sop['category'] for sop in self.sops_data))
+        self._build_category_index()
+        self._by_id: Dict[str, Dict[str, Any]] = {sop['id']: sop for sop in self.sops_data}
         self.selected_category = "All"
 
-        # Initialize search
+        # Memoized filter results and the ids currently rendered on screen
+        self._filter_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._last_rendered_ids = None
+
+        # Pooled card widgets keyed by SOP id (reused across filter passes)
+        self._card_pool: Dict[str, Dict[str, Any]] = {}
+        self._empty_state_frame = None
+
+        # Viewport virtualization - only rows intersecting the view get cards
+        self._display_list: List[Dict[str, Any]] = []
+        self._visible_ids = set()
+        self._configured_rows = 0
+        self._render_after_id = None
+        self._layout_suspended = False
+
+        # Initialize search (filtering is debounced to coalesce keystrokes)
+        self._filter_after_id = None
         self.search_var = ctk.StringVar()
-        self.search_var.trace('w', lambda *args: self.filter_sops())
+        self.search_var.trace('w', lambda *args: self._schedule_filter())
 
         super().__init__(parent, state_manager, event_bus, **kwargs)
 
     def setup_ui(self):
         """Set up the SOPs page UI"""
+        self._fonts = _get_fonts()
+
         # Main container
         main_container = ctk.CTkFrame(self, fg_color="transparent")
         main_container.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
@@ -122,7 +211,7 @@ class SOPsPage(BasePage):
         title_label = ctk.CTkLabel(
             header_frame,
             text="Standard Operating Procedures",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self._fonts['header']
         )
         title_label.grid(row=0, column=0, sticky="w")
 
@@ -130,7 +219,7 @@ class SOPsPage(BasePage):
         desc_label = ctk.CTkLabel(
             header_frame,
             text="Browse guides and tutorials for running different scripts effectively",
-            font=ctk.CTkFont(size=14),
+            font=self._fonts['body'],
             text_color=("gray40", "gray60")
         )
         desc_label.grid(row=1, column=0, sticky="w", pady=(5, 0))
@@ -142,7 +231,7 @@ class SOPsPage(BasePage):
         total_label = ctk.CTkLabel(
             stats_frame,
             text=f"{len(self.sops_data)} SOPs Available",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._fonts['label_bold'],
             text_color=("#1f6aa5", "#1f6aa5")
         )
         total_label.grid(row=0, column=0, padx=10)
@@ -157,7 +246,7 @@ class SOPsPage(BasePage):
         filter_label = ctk.CTkLabel(
             control_frame,
             text="Category:",
-            font=ctk.CTkFont(size=14)
+            font=self._fonts['body']
         )
         filter_label.grid(row=0, column=0, padx=(20, 10), pady=15)
 
@@ -176,7 +265,7 @@ class SOPsPage(BasePage):
         search_label = ctk.CTkLabel(
             search_frame,
             text="🔍",
-            font=ctk.CTkFont(size=16)
+            font=self._fonts['search_icon']
         )
         search_label.grid(row=0, column=0, padx=(0, 5))
 
@@ -204,214 +293,400 @@ class SOPsPage(BasePage):
         self.scrollable_frame.grid_columnconfigure(0, weight=1)
         self.scrollable_frame.grid_columnconfigure(1, weight=1)
 
+        # Re-render the visible cards whenever the canvas view moves or resizes
+        self.scrollable_frame._parent_canvas.configure(yscrollcommand=self._on_canvas_yview)
+
+    def _on_canvas_yview(self, first, last):
+        """Forward canvas view changes to the scrollbar and refresh visible cards"""
+        self.scrollable_frame._scrollbar.set(first, last)
+        if not self._layout_suspended:
+            self._schedule_render()
+
+    def _schedule_render(self):
+        """Coalesce view changes into a single render pass when Tk is idle"""
+        if self._render_after_id is None:
+            self._render_after_id = self.after_idle(self._render_visible)
+
     def display_sops(self, sops_list):
-        """Display SOP cards in a grid layout"""
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        """Display SOP cards in a grid layout, reusing pooled card widgets"""
+        self._last_rendered_ids = [sop['id'] for sop in sops_list]
+        self._display_list = sops_list
+
+        # Hide existing cards instead of destroying them
+        for refs in self._card_pool.values():
+            refs['card'].grid_remove()
+        self._visible_ids = set()
+
+        if self._empty_state_frame is not None:
+            self._empty_state_frame.grid_remove()
 
         if not sops_list:
             # Show empty state
+            self._apply_row_minsize(0)
             self.show_empty_state()
             return
 
-        # Create SOP cards in a 2-column grid
-        for i, sop in enumerate(sops_list):
-            row = i // 2
-            col = i % 2
-            self.create_sop_card(sop, row, col)
+        # Reserve every row so the scroll region spans the whole list,
+        # then only show the SOP cards in the 2-column grid that are in view
+        self._apply_row_minsize((len(sops_list) + 1) // 2)
+        self._render_visible()
+
+    def _suspend_layout(self):
+        """Stop the card grid from recomputing its size while cards are (re)gridded"""
+        self._layout_suspended = True
+        self.scrollable_frame.grid_propagate(False)
+
+    def _resume_layout(self):
+        """Re-enable geometry propagation and run one layout pass for the batch"""
+        self.scrollable_frame.grid_propagate(True)
+        self.update_idletasks()
+        self._layout_suspended = False
+
+    def _row_height(self) -> int:
+        """Card row height in screen pixels (CTk scales widget sizes and padding)"""
+        return round(self._apply_widget_scaling(_CARD_ROW_HEIGHT))
+
+    def _apply_row_minsize(self, n_rows: int):
+        """Give the first n_rows grid rows the card row height and reset the rest"""
+        row_height = self._row_height()
+        for row in range(n_rows):
+            self.scrollable_frame.grid_rowconfigure(row, minsize=row_height)
+        for row in range(n_rows, self._configured_rows):
+            self.scrollable_frame.grid_rowconfigure(row, minsize=0)
+        self._configured_rows = n_rows
+
+    def _visible_range(self) -> tuple:
+        """Return the first and last grid rows intersecting the viewport"""
+        row_height = self._row_height()
+        n_rows = (len(self._display_list) + 1) // 2
+
+        canvas = self.scrollable_frame._parent_canvas
+        view_height = canvas.winfo_height()
+        if view_height <= 1:
+            # Not mapped yet - assume the viewport is as tall as the window
+            view_height = WINDOW_SIZE[1]
+
+        top = canvas.yview()[0] * n_rows * row_height
+        first_row = max(0, int(top // row_height) - _OVERSCAN_ROWS)
+        last_row = min(n_rows - 1, int((top + view_height) // row_height) + _OVERSCAN_ROWS)
+        return first_row, last_row
+
+    def _render_visible(self):
+        """Show cards for the rows in the viewport and hide the ones scrolled away"""
+        self._render_after_id = None
+        if not self._display_list:
+            return
+
+        first_row, last_row = self._visible_range()
+        start = first_row * 2
+        visible = self._display_list[start:(last_row + 1) * 2]
+        visible_ids = {sop['id'] for sop in visible}
+
+        # Batch the widget changes into a single geometry pass
+        self._suspend_layout()
+        try:
+            for sop_id in self._visible_ids - visible_ids:
+                refs = self._card_pool.get(sop_id)
+                if refs:
+                    refs['card'].grid_remove()
+
+            for i, sop in enumerate(visible, start=start):
+                if sop['id'] not in self._visible_ids:
+                    self.create_sop_card(sop, i // 2, i % 2)
+
+            self._visible_ids = visible_ids
+        finally:
+            self._resume_layout()
 
     def create_sop_card(self, sop: Dict[str, Any], row: int, col: int):
-        """Create a card for an SOP"""
+        """Show the card for an SOP, building it only if it isn't pooled yet"""
+        refs = self._card_pool.get(sop['id'])
+        if refs is None:
+            refs = self._build_card(sop)
+            self._card_pool[sop['id']] = refs
+            # Cards built after the first screen missed the scroll frame's binding pass
+            self.bind_scroll_events(refs['card'])
+        elif refs['sop'] is not sop:
+            self._update_card(refs, sop)
+
+        refs['card'].grid(row=row, column=col, padx=10, pady=_CARD_PADY, sticky="nsew")
+
+    def _build_card(self, sop: Dict[str, Any]) -> Dict[str, Any]:
+        """Create the widgets for an SOP card and return references to them"""
         # Card frame
         card = ctk.CTkFrame(
             self.scrollable_frame,
             corner_radius=10,
             border_width=2,
-            border_color=("gray70", "gray30")
+            border_color=_CARD_BORDER_COLOR,
+            height=_CARD_ROW_HEIGHT - 2 * _CARD_PADY
         )
-        card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-        # self.scrollable_frame.grid_rowconfigure(row, weight=1) # Keep row weight if you want all cards in a row to have same height
+        # Keep the fixed height whatever the content asks for; the content fills it
+        card.grid_propagate(False)
+        card.grid_rowconfigure(0, weight=1)
+        card.grid_columnconfigure(0, weight=1)
 
-        # Card content
+        # Card content - every widget sits directly in this grid:
+        # row 0 icon + title, row 1 badges, row 2 description, row 3 tags, row 4 button
         content_frame = ctk.CTkFrame(card, fg_color="transparent")
         content_frame.grid(row=0, column=0, padx=15, pady=15, sticky="nsew")  # Reduced padx/pady a bit
-        content_frame.grid_columnconfigure(0, weight=1)  # Allow content to fill width
-
-        # Icon and title
-        title_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-        title_frame.grid(row=0, column=0, sticky="ew")
-        # title_frame.grid_columnconfigure(0, weight=0) # Icon column
-        title_frame.grid_columnconfigure(1, weight=1)  # Title label column (allow to expand)
+        # Columns 0-2 hold the badges; the last column absorbs the spare width
+        content_frame.grid_columnconfigure(_CARD_COLUMNS - 1, weight=1)
+        # If the content is still too tall, the description row gives up space
+        # (and is clipped) first, so the button stays visible
+        content_frame.grid_rowconfigure(2, weight=1)
 
+        # Icon and title share row 0; the title is offset past the icon
         icon_label = ctk.CTkLabel(
-            title_frame,
-            text=sop.get('icon', '📄'),
-            font=ctk.CTkFont(size=24)
+            content_frame,
+            text="",
+            font=self._fonts['icon']
         )
-        icon_label.grid(row=0, column=0, padx=(0, 10), sticky="ns")
+        icon_label.grid(row=0, column=0, sticky="w")
 
         title_label = ctk.CTkLabel(
-            title_frame,
-            text=sop.get('title', 'No Title'),
-            font=ctk.CTkFont(size=16, weight="bold"),
+            content_frame,
+            text="",
+            font=self._fonts['title'],
             anchor="w",
             justify="left",  # Ensure text is left-justified when wrapped
-            wraplength=220  # *** ADDED: Adjust this based on your card width / icon size / padding ***
+            wraplength=220  # Adjust this based on your card width / icon size / padding
         )
-        title_label.grid(row=0, column=1, sticky="ew")
-
-        # Category, difficulty, and duration badges
-        badge_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-        badge_frame.grid(row=1, column=0, pady=(8, 0),
-                         sticky="ew")  # Use sticky="ew" to allow internal elements to align
-        # We'll let the badges flow using grid columns within badge_frame
-
-        current_badge_column = 0
-        badge_wraplength = 70  # *** ADDED: wraplength for individual badges ***
+        title_label.grid(row=0, column=0, columnspan=_CARD_COLUMNS, padx=(_ICON_GUTTER, 0), sticky="ew")
 
-        if sop.get('category'):
-            category_badge = ctk.CTkLabel(
-                badge_frame,
-                text=sop['category'],
-                font=ctk.CTkFont(size=11),
-                fg_color=("#e0e0e0", "#374151"),
-                corner_radius=12,
-                padx=8,
-                pady=2,
-                wraplength=badge_wraplength,  # *** ADDED ***
-                justify="center"
-            )
-            category_badge.grid(row=0, column=current_badge_column, padx=(0, 5), pady=(0, 2), sticky="w")
-            current_badge_column += 1
+        # Category, difficulty, and duration badges (placed in _update_card)
+        # Badge and tag text is short, so these leaf labels don't set a wraplength
+        category_badge = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self._fonts['badge'],
+            fg_color=("#e0e0e0", "#374151"),
+            corner_radius=12,
+            padx=8,
+            pady=2,
+            justify="center"
+        )
 
-        if sop.get('difficulty'):
-            diff_colors = {
-                'Beginner': ("#4CAF50", "#2d5a2f"),
-                'Intermediate': ("#FF9800", "#b36a00"),
-                'Advanced': ("#f44336", "#961f17")
-            }
-            difficulty_badge = ctk.CTkLabel(
-                badge_frame,
-                text=sop['difficulty'],
-                font=ctk.CTkFont(size=11),
-                fg_color=diff_colors.get(sop['difficulty'], ("#757575", "#424242")),
-                text_color="white",
-                corner_radius=12,
-                padx=8,
-                pady=2,
-                wraplength=badge_wraplength,  # *** ADDED ***
-                justify="center"
-            )
-            difficulty_badge.grid(row=0, column=current_badge_column, padx=5 if current_badge_column > 0 else (0, 5),
-                                  pady=(0, 2), sticky="w")
-            current_badge_column += 1
+        difficulty_badge = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self._fonts['badge'],
+            text_color="white",
+            corner_radius=12,
+            padx=8,
+            pady=2,
+            justify="center"
+        )
 
-        if sop.get('duration'):
-            duration_label = ctk.CTkLabel(
-                badge_frame,
-                text=f"⏱️ {sop['duration']}",
-                font=ctk.CTkFont(size=11),
-                text_color=("gray40", "gray60"),
-                wraplength=badge_wraplength + 20,  # Duration might be slightly longer with icon
-                justify="center"
-            )
-            duration_label.grid(row=0, column=current_badge_column, padx=5 if current_badge_column > 0 else (0, 5),
-                                pady=(0, 2), sticky="w")
+        duration_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self._fonts['badge'],
+            text_color=("gray40", "gray60"),
+            justify="center"
+        )
 
         # Description
         desc_label = ctk.CTkLabel(
             content_frame,
-            text=sop.get('description', ''),
-            font=ctk.CTkFont(size=12),
+            text="",
+            font=self._fonts['desc'],
             text_color=("gray30", "gray70"),
             anchor="w",
             justify="left",
-            wraplength=250  # This was already there, ensure it's appropriate
+            wraplength=250
         )
-        desc_label.grid(row=2, column=0, pady=(8, 0), sticky="ew")
-
-        # Tags
-        if sop.get('tags'):
-            tags_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-            tags_frame.grid(row=3, column=0, pady=(8, 0), sticky="ew")  # Use sticky="ew"
-            # Add column configure for tags frame to allow wrapping if you have many tags
-            # For now, limiting to 3 tags should prevent overflow issues mostly
-
-            for i, tag_text in enumerate(sop['tags'][:3]):
-                tag_label = ctk.CTkLabel(
-                    tags_frame,
-                    text=f"#{tag_text}",
-                    font=ctk.CTkFont(size=10),
-                    text_color=("#1f6aa5", "#4d94ff"),
-                    wraplength=70,  # *** ADDED: Optional wraplength for individual tags ***
-                    justify="left"
-                )
-                tag_label.grid(row=0, column=i, padx=(0, 8), sticky="w")
-
-        # Action buttons
-        button_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
-        button_frame.grid(row=4, column=0, pady=(15, 0), sticky="ew")
-        button_frame.grid_columnconfigure(0, weight=1)  # Allow button to fill width
+        desc_label.grid(row=2, column=0, columnspan=_CARD_COLUMNS, pady=(8, 0), sticky="ew")
 
+        # Tags share one style, so a single label holds all of them
+        tags_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=self._fonts['tag'],
+            text_color=("#1f6aa5", "#4d94ff"),
+            anchor="w",
+            justify="left"
+        )
+
+        # Action button
         view_btn = ctk.CTkButton(
-            button_frame,
+            content_frame,
             text="View SOP",
-            command=lambda s=sop: self.open_sop(s),
             height=32,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._fonts['label_bold']
         )
-        view_btn.grid(row=0, column=0, sticky="ew", padx=(0, 5))
+        view_btn.grid(row=4, column=0, columnspan=_CARD_COLUMNS, pady=(15, 0), sticky="ew", padx=(0, 5))
 
         # Make card interactive
-        card.bind("<Enter>", lambda e, c=card: c.configure(border_color=("#1f6aa5", "#1f6aa5")))
-        card.bind("<Leave>", lambda e, c=card: c.configure(border_color=("gray70", "gray30")))
+        card.bind("<Enter>", self._on_card_enter)
+        card.bind("<Leave>", self._on_card_leave)
+
+        refs = {
+            'card': card,
+            'icon_label': icon_label,
+            'title_label': title_label,
+            'category_badge': category_badge,
+            'difficulty_badge': difficulty_badge,
+            'duration_label': duration_label,
+            'desc_label': desc_label,
+            'tags_label': tags_label,
+            'view_btn': view_btn,
+        }
+        self._update_card(refs, sop)
+        return refs
+
+    @staticmethod
+    def _card_from_event(event):
+        """Resolve the card frame for a hover event (CTk binds on its inner canvas)"""
+        widget = event.widget
+        while widget is not None and not isinstance(widget, ctk.CTkFrame):
+            widget = widget.master
+        return widget
+
+    def _on_card_enter(self, event):
+        """Highlight a card border on hover"""
+        card = self._card_from_event(event)
+        if card is not None:
+            card.configure(border_color=_CARD_HIGHLIGHT_COLOR)
+
+    def _on_card_leave(self, event):
+        """Restore a card border when the pointer leaves"""
+        card = self._card_from_event(event)
+        if card is not None:
+            card.configure(border_color=_CARD_BORDER_COLOR)
+
+    def _update_card(self, refs: Dict[str, Any], sop: Dict[str, Any]):
+        """Fill a pooled card's widgets with the data of an SOP"""
+        refs['sop'] = sop
+
+        refs['icon_label'].configure(text=sop.get('icon', '📄'))
+        refs['title_label'].configure(text=_truncate(sop.get('title', 'No Title'), _TITLE_MAX_CHARS))
+        refs['desc_label'].configure(text=_truncate(sop.get('description', ''), _DESC_MAX_CHARS))
+
+        # Badges are placed left to right, skipping any the SOP doesn't define
+        current_badge_column = 0
+
+        if sop.get('category'):
+            refs['category_badge'].configure(text=_truncate(sop['category'], _BADGE_MAX_CHARS))
+            refs['category_badge'].grid(row=1, column=current_badge_column, padx=(0, 5), pady=(8, 2), sticky="w")
+            current_badge_column += 1
+        else:
+            refs['category_badge'].grid_remove()
+
+        if sop.get('difficulty'):
+            refs['difficulty_badge'].configure(
+                text=sop['difficulty'],
+                fg_color=_DIFFICULTY_COLORS.get(sop['difficulty'], ("#757575", "#424242"))
+            )
+            refs['difficulty_badge'].grid(row=1, column=current_badge_column,
+                                          padx=5 if current_badge_column > 0 else (0, 5),
+                                          pady=(8, 2), sticky="w")
+            current_badge_column += 1
+        else:
+            refs['difficulty_badge'].grid_remove()
+
+        if sop.get('duration'):
+            refs['duration_label'].configure(text=f"⏱️ {sop['duration']}")
+            refs['duration_label'].grid(row=1, column=current_badge_column,
+                                        padx=5 if current_badge_column > 0 else (0, 5),
+                                        pady=(8, 2), sticky="w")
+        else:
+            refs['duration_label'].grid_remove()
+
+        # Tags (limiting to 3 tags prevents overflow issues mostly)
+        tags = sop.get('tags', [])[:3]
+        if tags:
+            refs['tags_label'].configure(text="   ".join(f"#{tag}" for tag in tags))
+            refs['tags_label'].grid(row=3, column=0, columnspan=_CARD_COLUMNS, pady=(8, 0), sticky="w")
+        else:
+            refs['tags_label'].grid_remove()
+
+        refs['view_btn'].configure(command=partial(self.open_sop, sop))
 
     def show_empty_state(self):
         """Show empty state when no SOPs match the filter"""
-        empty_frame = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
-        empty_frame.grid(row=0, column=0, columnspan=2, padx=50, pady=50)
+        if self._empty_state_frame is None:
+            self._empty_state_frame = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
+
+            empty_label = ctk.CTkLabel(
+                self._empty_state_frame,
+                text="No SOPs found",
+                font=self._fonts['empty_title'],
+                text_color=("gray40", "gray60")
+            )
+            empty_label.grid(row=0, column=0, pady=(0, 10))
 
-        empty_label = ctk.CTkLabel(
-            empty_frame,
-            text="No SOPs found",
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=("gray40", "gray60")
-        )
-        empty_label.grid(row=0, column=0, pady=(0, 10))
+            help_label = ctk.CTkLabel(
+                self._empty_state_frame,
+                text="Try adjusting your search or filter criteria",
+                font=self._fonts['body'],
+                text_color=("gray30", "gray70")
+            )
+            help_label.grid(row=1, column=0)
 
-        help_label = ctk.CTkLabel(
-            empty_frame,
-            text="Try adjusting your search or filter criteria",
-            font=ctk.CTkFont(size=14),
-            text_color=("gray30", "gray70")
-        )
-        help_label.grid(row=1, column=0)
+        self._empty_state_frame.grid(row=0, column=0, columnspan=2, padx=50, pady=50)
+
+    def _build_category_index(self):
+        """Bucket SOPs by category so filtering only scans the selected one"""
+        by_category = defaultdict(list)
+        for sop in self.sops_data:
+            by_category[sop['category']].append(sop)
+
+        self._by_category: Dict[str, List[Dict[str, Any]]] = dict(by_category)
+        self._by_category["All"] = self.sops_data
+
+    @staticmethod
+    def _index_sop(sop: Dict[str, Any]):
+        """Store the lowercased searchable text of an SOP on the SOP itself"""
+        sop['_search_blob'] = f"{sop['title']} {sop['description']} {' '.join(sop['tags'])}".lower()
 
     def filter_sops(self):
         """Filter SOPs based on search and category"""
         search_term = self.search_var.get().lower()
-        filtered_sops = []
+        cache_key = (search_term, self.selected_category)
 
-        for sop in self.sops_data:
-            # Category filter
-            if self.selected_category != "All" and sop['category'] != self.selected_category:
-                continue
-
-            # Search filter
-            if search_term:
-                searchable_text = f"{sop['title']} {sop['description']} {' '.join(sop['tags'])}".lower()
-                if search_term not in searchable_text:
+        if not search_term and self.selected_category == "All":
+            # Nothing to filter - show the full list as-is
+            filtered_sops = self.sops_data
+        else:
+            filtered_sops = self._filter_cache.get(cache_key)
+
+        if filtered_sops is None:
+            filtered_sops = []
+
+            # Category filter - only walk the selected category's bucket
+            candidates = self._by_category.get(self.selected_category, [])
+
+            for sop in candidates:
+                # Search filter
+                if search_term and search_term not in sop['_search_blob']:
                     continue
 
-            filtered_sops.append(sop)
+                filtered_sops.append(sop)
+
+            self._filter_cache[cache_key] = filtered_sops
+
+        # Skip the redraw when the same cards are already on screen
+        if [sop['id'] for sop in filtered_sops] == self._last_rendered_ids:
+            return
 
         self.display_sops(filtered_sops)
 
+    def _schedule_filter(self):
+        """Schedule a filter pass, replacing any pass that is still pending"""
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(SEARCH_DEBOUNCE_DELAY, self._run_filter)
+
+    def _run_filter(self):
+        """Run the pending filter pass"""
+        self._filter_after_id = None
+        self.filter_sops()
+
     def on_category_changed(self, category):
         """Handle category filter change"""
         self.selected_category = category
-        self.filter_sops()
+        self._schedule_filter()
 
     def open_sop(self, sop: Dict[str, Any]):
         """Open the SOP link in the default browser"""
@@ -427,15 +702,34 @@ class SOPsPage(BasePage):
 
     def add_sop(self, sop_data: Dict[str, Any]):
         """Add a new SOP to the list - for easy extensibility"""
+        self._index_sop(sop_data)
         self.sops_data.append(sop_data)
-        self.categories = list(set(sop['category'] for sop in self.sops_data))
-        self.category_menu.configure(values=["All"] + sorted(self.categories))
+        self._by_category.setdefault(sop_data['category'], []).append(sop_data)
+        self._by_id[sop_data['id']] = sop_data
+        self._filter_cache.clear()
+
+        # Only touch the menu when a new category appears
+        if sop_data['category'] not in self.categories:
+            self.categories.append(sop_data['category'])
+            self.category_menu.configure(values=["All"] + sorted(self.categories))
+
         self.filter_sops()
 
     def remove_sop(self, sop_id: str):
         """Remove an SOP from the list"""
-        # self.sops_data = [sop for sop in self.sops_data if sop['id'] != sop_id]
-        self.sops_data = SOPS_DATA  # This line is for selecting the data from hte SOP Config file. Use the line above if you want to use the values on this file.
+        sop = self._by_id.pop(sop_id, None)
+        if sop is None:
+            return
+
+        self.sops_data.remove(sop)
+        self._by_category[sop['category']].remove(sop)
+        self._filter_cache.clear()
+
+        # Removed SOPs are the only cards that get destroyed
+        refs = self._card_pool.pop(sop_id, None)
+        if refs:
+            refs['card'].destroy()
+
         self.filter_sops()
 
     def on_activate(self):
@@ -458,19 +752,52 @@ class SOPsPage(BasePage):
         self.selected_category = "All"
         self.category_menu.set("All")
 
-        # Redisplay all SOPs
-        self.display_sops(self.sops_data)
+        # Show the full list - a no-op when it is already on screen
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        self.filter_sops()
 
-        # Find the SOP card and highlight it
-        # This would require storing card references during creation
-        # For now, just show a message
-        for sop in self.sops_data:
-            if sop['id'] == sop_id:
-                self.show_message(f"Highlighted: {sop['title']}", "info")
-                break
+        sop = self._by_id.get(sop_id)
+        if sop:
+            self._scroll_to_sop(sop)
+            self.show_message(f"Highlighted: {sop['title']}", "info")
+
+    def _scroll_to_sop(self, sop: Dict[str, Any]):
+        """Scroll the pooled card of an SOP into view and flash its border"""
+        self.update_idletasks()
+
+        refs = self._card_pool.get(sop['id'])
+        if refs and sop['id'] in self._visible_ids:
+            y = refs['card'].winfo_y() / max(1, self.scrollable_frame.winfo_height())
+        else:
+            # Card not rendered yet - estimate its offset from its grid row
+            index = self._display_list.index(sop)
+            y = (index // 2) / ((len(self._display_list) + 1) // 2)
+
+        self.scrollable_frame._parent_canvas.yview_moveto(y)
+        self._render_visible()
+
+        refs = self._card_pool.get(sop['id'])
+        if refs:
+            refs['card'].configure(border_color=_CARD_HIGHLIGHT_COLOR)
+            self.after(_HIGHLIGHT_DURATION, partial(refs['card'].configure, border_color=_CARD_BORDER_COLOR))
 
     def setup_event_subscriptions(self):
         """Set up event subscriptions"""
         # Listen for SOP-related events
-        self.event_bus.subscribe('sop.added', lambda data: self.add_sop(data))
-        self.event_bus.subscribe('sop.removed', lambda data: self.remove_sop(data['id']))
+        self.event_bus.subscribe('sop.added', self.add_sop)
+        self.event_bus.subscribe('sop.removed', self._on_sop_removed)
+
+    def _on_sop_removed(self, data: Dict[str, Any]):
+        """Handle the sop.removed event"""
+        self.remove_sop(data['id'])
+
+    def cleanup(self):
+        """Clean up resources when page is destroyed"""
+        # Cancel any pending filter or render pass
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+        if self._render_after_id:
+            self.after_cancel(self._render_after_id)
+        super().cleanup()
@@ -0,0 +1,192 @@
+"""
+Shared helpers for the Outlook attachment saver scripts: console logging,
+OneDrive folder discovery and the Outlook running check.
+"""
+
+import sys
+import os
+import ctypes
+import functools
+from collections import deque
+from datetime import datetime
+
+
+# (start_path, components, max_depth) -> resolved path or None
+DENTRY_CACHE = {}
+
+# Team-site folders that never lead to the script folders (SharePoint's own
+# Forms and _vti_* folders, mail attachments, archives and Teams recordings)
+SKIP_DIRS = frozenset({'Attachments', 'Forms', 'Archive', 'Recordings'})
+
+# Window class of Outlook's main window
+OUTLOOK_WINDOW_CLASS = "rctrl_renwnd32"
+
+
+class LogLevel:
+    DEBUG = "[DEBUG]"
+    INFO = "[INFO]"
+    SUCCESS = "[SUCCESS]"
+    WARNING = "[WARNING]"
+    ERROR = "[ERROR]"
+
+
+LOG_LEVELS = {
+    LogLevel.DEBUG: 10,
+    LogLevel.INFO: 20,
+    LogLevel.SUCCESS: 25,
+    LogLevel.WARNING: 30,
+    LogLevel.ERROR: 40,
+}
+
+# The console filters DEBUG lines itself (developer mode), so everything is
+# printed unless ATTACHMENTS_LOG raises the threshold, e.g. ATTACHMENTS_LOG=INFO
+MIN_LOG_LEVEL = LOG_LEVELS.get(f"[{os.environ.get('ATTACHMENTS_LOG', 'DEBUG').upper()}]", 10)
+
+# Send each line to the script runner as soon as it is printed
+sys.stdout.reconfigure(line_buffering=True)
+
+
+def log_enabled(level):
+    """Check whether messages at this level are printed"""
+    return LOG_LEVELS[level] >= MIN_LOG_LEVEL
+
+
+def log(level, message, *args):
+    """Print a log message with timestamp and level
+
+    Extra args are %-formatted into the message only if the level is enabled.
+    """
+    if LOG_LEVELS[level] < MIN_LOG_LEVEL:
+        return
+    if args:
+        message = message % args
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    print(f"{timestamp} {level} {message}")
+
+
+def _log_debug(message, *args):
+    log(LogLevel.DEBUG, message, *args)
+
+
+@functools.lru_cache(maxsize=None)
+def find_path_with_components(folder_components, log_debug=_log_debug):
+    """Find a path containing the specified folder components.
+
+    log_debug takes a %-style message and args, so scripts with their own
+    logger can pass logger.debug.
+    """
+    log_debug("Searching for path with components: %s", folder_components)
+
+    home_dir = os.path.expanduser('~')
+    # Define all possible base directories
+    possible_bases = [
+        os.path.join(home_dir, 'Kodiak Cakes'),
+        os.path.join(home_dir, 'OneDrive - Kodiak Cakes')
+    ]
+
+    # Define possible entry points from each base
+    possible_entry_points = [
+        ['Kodiak Cakes Team Site - Public'],
+        ['Kodiak Cakes Team Site - Accounting', 'Public'],
+        ['']  # Empty entry point for direct access
+    ]
+
+    for base in possible_bases:
+        log_debug("Checking base directory: %s", base)
+        if not os.path.exists(base):
+            log_debug("Base directory does not exist: %s", base)
+            continue
+
+        for entry_point in possible_entry_points:
+            current_path = base
+            for entry in entry_point:
+                if entry:  # Skip empty entry
+                    test_path = os.path.join(current_path, entry)
+                    if not os.path.exists(test_path):
+                        break
+                    current_path = test_path
+
+            result = find_components_flexible(current_path, folder_components, log_debug=log_debug)
+            if result:
+                log_debug("Found valid path: %s", result)
+                return result
+
+    log_debug("No valid path found")
+    return None
+
+
+def find_components_flexible(start_path, components, max_depth=3, log_debug=_log_debug):
+    """Find folder components below start_path with flexible matching.
+
+    Results are remembered in DENTRY_CACHE, so the same search from the
+    same starting folder is only done once per run. log_debug takes a
+    %-style message and args, so scripts with their own logger can pass
+    logger.debug.
+    """
+    key = (start_path, tuple(components), max_depth)
+    if key not in DENTRY_CACHE:
+        DENTRY_CACHE[key] = _find_components_flexible(start_path, tuple(components), max_depth, log_debug)
+    return DENTRY_CACHE[key]
+
+
+def _find_components_flexible(start_path, components, max_depth, log_debug):
+    # Breadth-first over (path, remaining components, depth) so the shallowest
+    # match wins and the search stops as soon as every component is matched
+    queue = deque([(start_path, components, 0)])
+    visited = set()
+
+    while queue:
+        current_path, remaining, depth = queue.popleft()
+        if not remaining:
+            return current_path
+        if (current_path, remaining) in visited:
+            continue
+        visited.add((current_path, remaining))
+
+        next_component = remaining[0]
+        direct_path = os.path.join(current_path, next_component)
+
+        if os.path.exists(direct_path):
+            if len(remaining) == 1:
+                return direct_path
+            # Following the exact path costs no depth, so try it first
+            queue.appendleft((direct_path, remaining[1:], depth))
+
+        try:
+            # scandir reports the entry type from the directory listing itself,
+            # avoiding a separate stat per child on OneDrive
+            with os.scandir(current_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or not entry.is_dir():
+                        continue
+                    if entry.name != next_component and (entry.name in SKIP_DIRS or entry.name.startswith('_vti_')):
+                        continue
+                    if entry.name == next_component:
+                        queue.append((entry.path, remaining[1:], depth))
+                    if depth < max_depth:
+                        queue.append((entry.path, remaining, depth + 1))
+        except (PermissionError, FileNotFoundError) as e:
+            log_debug("Access denied or file not found: %s", e)
+
+    return None
+
+
+def is_outlook_open(log_debug=_log_debug):
+    """Check if Outlook is currently running."""
+    log_debug("Checking if Outlook is running...")
+    # Outlook's main window exists (hidden or not) while it runs, and a window
+    # lookup is a single call instead of opening every process on the system
+    if ctypes.windll.user32.FindWindowW(OUTLOOK_WINDOW_CLASS, None):
+        log_debug("Outlook window found")
+        return True
+
+    # Outlook can also run headless (e.g. started by another program), so
+    # confirm with the process list before reporting it closed; psutil is only
+    # needed here, so importing this module does not load it
+    import psutil
+    for process in psutil.process_iter(['name']):
+        if process.info['name'] == "OUTLOOK.EXE":
+            log_debug("Outlook process found")
+            return True
+    log_debug("Outlook process not found")
+    return False
@@ -12,10 +12,86 @@ import re
 import glob
 import operator
 import random
+import functools
 import json
 import pickle
 from datetime import datetime
 
+try:
+    import pyarrow  # noqa: F401 - only needed as the pandas CSV engine
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Multithreaded Arrow parser when installed, pandas' C parser otherwise
+CSV_ENGINE = 'pyarrow' if PYARROW_AVAILABLE else 'c'
+
+# Below this many transactions the numba compile time outweighs the speedup
+NUMBA_MIN_ROWS = 10000
+
+# Team site roots to try under the OneDrive folder, in order
+ALTERNATE_ROOT_PATHS = (
+    ('Kodiak Cakes Team Site - Private',),
+    ('Kodiak Cakes Team Site - Accounting', 'Private')
+)
+
+# Fields copied from the mapping file onto each transaction
+MAPPED_FIELDS = ['Merchant Category', 'GL Name', 'GL Internal ID',
+                 'Transaction Cost Center', 'Cost Center Internal ID',
+                 'Customer Internal ID', 'Customer', 'Line Memo']
+
+# Mapped fields whose value may be a list of amount-based IF/THEN rules
+CONDITIONAL_FIELDS = ['GL Name', 'GL Internal ID']
+
+# A single 'IF <condition> THEN <result>' clause of a conditional rule
+RULE_PATTERN = re.compile(r'IF\s*(.+?)\s*THEN\s*(.+?)\s*$')
+
+# Columns read from the transaction mapping file
+MAPPING_COLS = ['Merchant Name', 'Card Name'] + MAPPED_FIELDS + ['Include Memo']
+
+# Low-cardinality mapping columns parsed straight into categoricals
+MAPPING_DTYPES = {'Merchant Name': 'category', 'Card Name': 'category', 'Include Memo': 'category'}
+
+# Part of the mapping cache key; bump whenever parse_conditional, compile_condition
+# or create_mapping_dict change what ends up in the cached mapping dict
+MAPPING_CACHE_VERSION = 1
+
+# Columns used to join transactions onto their mapping rule
+MERGE_KEYS = ['Mapping Merchant Name', 'Card Name']
+
+# Repetitive text columns stored as categoricals to save memory
+CATEGORICAL_COLUMNS = ['Card Name', 'Clean Merchant Name']
+
+# Comparison operators allowed in conditional rules, longest first so '>='
+# is matched before '>'
+CONDITION_OPERATORS = {
+    '>=': operator.ge,
+    '<=': operator.le,
+    '>': operator.gt,
+    '<': operator.lt,
+    '==': operator.eq,
+    '!=': operator.ne
+}
+
+# Operator to use when a rule is written with the amount on the right
+FLIPPED_OPERATORS = {'>=': '<=', '<=': '>=', '>': '<', '<': '>', '==': '==', '!=': '!='}
+
+# Integer codes for compiled rule operators, as understood by the numba kernel
+RULE_OPERATOR_CODES = {
+    operator.gt: 0,
+    operator.ge: 1,
+    operator.lt: 2,
+    operator.le: 3,
+    operator.eq: 4,
+    operator.ne: 5
+}
+
 
 class LogLevel:
     DEBUG = "[DEBUG]"
@@ -39,41 +115,84 @@ class ScriptState:
         self.upload_df = None
         self.csv_upload_base_folder = None
         self.upload_template_file = None
+        self.upload_template_mtime = None
         self.phase = None
 
+    @staticmethod
+    def _frame_path(filepath):
+        return os.path.splitext(filepath)[0] + '.parquet'
+
     def save(self, filepath):
-        """Save state to file"""
-        with open(filepath, 'wb') as f:
-            pickle.dump(self, f)
+        """Save scalar fields to a JSON file and the DataFrame to a Parquet sidecar"""
+        fields = {key: value for key, value in vars(self).items() if key != 'upload_df'}
+        with open(filepath, 'w') as f:
+            json.dump(fields, f)
+
+        frame_path = self._frame_path(filepath)
+        if self.upload_df is None:
+            return
+        try:
+            self.upload_df.to_parquet(frame_path, index=False)
+        except Exception as e:
+            # Without the sidecar the resume simply re-reads the review workbook
+            log(LogLevel.DEBUG, f"Could not save upload data to Parquet: {str(e)}")
+            if os.path.exists(frame_path):
+                os.remove(frame_path)
 
     @classmethod
     def load(cls, filepath):
         """Load state from file"""
-        with open(filepath, 'rb') as f:
-            return pickle.load(f)
+        state = cls()
+        with open(filepath, 'r') as f:
+            vars(state).update(json.load(f))
+
+        frame_path = cls._frame_path(filepath)
+        if os.path.exists(frame_path):
+            state.upload_df = pd.read_parquet(frame_path)
+        return state
+
+    @classmethod
+    def remove(cls, filepath):
+        """Delete the state file and its Parquet sidecar"""
+        for path in (filepath, cls._frame_path(filepath)):
+            if os.path.exists(path):
+                os.remove(path)
 
 
 def find_valid_path(base_dir, alternate_paths):
     for path in alternate_paths:
         full_path = os.path.join(base_dir, *path)
-        if os.path.exists(full_path):
+        if _path_exists(full_path):
             return full_path, True
     return base_dir, False
 
 
-def get_folder_path(alternate_paths, folder_components):
-    home_dir = os.path.expanduser('~')
-    onedrive_dir = 'Kodiak Cakes'
-    base_dir = os.path.join(home_dir, onedrive_dir)
+@functools.lru_cache(maxsize=None)
+def _path_exists(path):
+    """os.path.exists, cached for the run since OneDrive stat calls are slow"""
+    return os.path.exists(path)
+
 
-    valid_path, found = find_valid_path(base_dir, alternate_paths)
+@functools.lru_cache(maxsize=1)
+def _resolve_root():
+    """Find the team site root once and share it across the get_* helpers"""
+    base_dir = os.path.join(os.path.expanduser('~'), 'Kodiak Cakes')
+
+    valid_path, found = find_valid_path(base_dir, ALTERNATE_ROOT_PATHS)
     if not found:
         log(LogLevel.ERROR, f"Could not find the valid base path starting from: '{base_dir}'")
         return None
+    return valid_path
+
+
+def get_folder_path(folder_components):
+    valid_path = _resolve_root()
+    if valid_path is None:
+        return None
 
     for component in folder_components:
         next_path = os.path.join(valid_path, component)
-        if not os.path.exists(next_path):
+        if not _path_exists(next_path):
             log(LogLevel.ERROR, f"Path resolution stopped at: '{valid_path}'. Could not find: '{component}'")
             return None
         valid_path = next_path
@@ -82,101 +201,109 @@ def get_folder_path(alternate_paths, folder_components):
 
 
 def get_transaction_mapping_file():
-    alternate_paths = [
-        ['Kodiak Cakes Team Site - Private'],
-        ['Kodiak Cakes Team Site - Accounting', 'Private']
-    ]
     folder_components = ['Banking', 'Bill Divvy', 'Imports', 'Excel Files', 'Transaction Mapping.csv']
-    return get_folder_path(alternate_paths, folder_components)
+    return get_folder_path(folder_components)
 
 
 def get_transaction_file_folder():
-    alternate_paths = [
-        ['Kodiak Cakes Team Site - Private'],
-        ['Kodiak Cakes Team Site - Accounting', 'Private']
-    ]
     folder_components = ['Banking', 'Bill Divvy', 'Imports', 'Transaction File']
-    return get_folder_path(alternate_paths, folder_components)
+    return get_folder_path(folder_components)
 
 
 def get_upload_template_file():
-    alternate_paths = [
-        ['Kodiak Cakes Team Site - Private'],
-        ['Kodiak Cakes Team Site - Accounting', 'Private']
-    ]
     folder_components = ['Banking', 'Bill Divvy', 'Imports', 'Divvy ME Upload Template.xlsx']
-    return get_folder_path(alternate_paths, folder_components)
+    return get_folder_path(folder_components)
 
 
 def get_csv_upload_base_folder():
-    alternate_paths = [
-        ['Kodiak Cakes Team Site - Private'],
-        ['Kodiak Cakes Team Site - Accounting', 'Private']
-    ]
     folder_components = ['Banking', 'Bill Divvy']
-    return get_folder_path(alternate_paths, folder_components)
+    return get_folder_path(folder_components)
 
 
 def create_mapping_dict(transaction_mapping_df):
     mapping_dict = {}
-    for index, row in transaction_mapping_df.iterrows():
+    # itertuples needs identifier-safe field names, so swap spaces for underscores
+    renamed_df = transaction_mapping_df.rename(columns=lambda col: col.replace(' ', '_'))
+    for row in renamed_df.itertuples(name='MappingRow'):
         try:
-            key = (row['Merchant Name'], row['Card Name'])
+            key = (row.Merchant_Name, row.Card_Name)
             value = {
-                'Merchant Category': row['Merchant Category'],
-                'GL Name': parse_conditional(row['GL Name']),
-                'GL Internal ID': parse_conditional(row['GL Internal ID']),
-                'Transaction Cost Center': row['Transaction Cost Center'],
-                'Cost Center Internal ID': row['Cost Center Internal ID'],
-                'Customer Internal ID': row['Customer Internal ID'],
-                'Customer': row['Customer'],
-                'Line Memo': row['Line Memo'],
-                'Include Memo': row['Include Memo'] == 'Yes'
+                'Merchant Category': row.Merchant_Category,
+                'GL Name': parse_conditional(row.GL_Name),
+                'GL Internal ID': parse_conditional(row.GL_Internal_ID),
+                'Transaction Cost Center': row.Transaction_Cost_Center,
+                'Cost Center Internal ID': row.Cost_Center_Internal_ID,
+                'Customer Internal ID': row.Customer_Internal_ID,
+                'Customer': row.Customer,
+                'Line Memo': row.Line_Memo,
+                'Include Memo': row.Include_Memo == 'Yes'
             }
             mapping_dict[key] = value
         except Exception as e:
-            log(LogLevel.ERROR, f"Error processing row {index} in transaction_mapping_df: {str(e)}")
-            log(LogLevel.DEBUG, f"Row data: {row}")
+            log(LogLevel.ERROR, f"Error processing row {row.Index} in transaction_mapping_df: {str(e)}")
+            log(LogLevel.DEBUG, f"Row data: {row._asdict()}")
+    return mapping_dict
+
+
+def get_mapping_cache_file():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), ".divvy_mapping_cache.pkl")
+
+
+def load_mapping_dict(transaction_mapping_file):
+    """Load the mapping dict, reusing the cached copy while the CSV is unchanged"""
+    stat = os.stat(transaction_mapping_file)
+    cache_key = (MAPPING_CACHE_VERSION, os.path.abspath(transaction_mapping_file), stat.st_mtime, stat.st_size)
+    cache_file = get_mapping_cache_file()
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('key') == cache_key:
+            log(LogLevel.DEBUG, "Using cached transaction mapping")
+            return cached['data']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log(LogLevel.DEBUG, f"Ignoring unreadable mapping cache: {str(e)}")
+
+    transaction_mapping_df = pd.read_csv(transaction_mapping_file, usecols=MAPPING_COLS, dtype=MAPPING_DTYPES)
+    mapping_dict = create_mapping_dict(transaction_mapping_df)
+
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump({'key': cache_key, 'data': mapping_dict}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        log(LogLevel.DEBUG, f"Could not write mapping cache: {str(e)}")
+
     return mapping_dict
 
 
 def parse_conditional(value):
+    """Compile 'IF Amount > 100 THEN x; ...' rules into (op_fn, threshold, result) tuples"""
     if not isinstance(value, str) or not 'IF' in value:
         return value
 
-    conditions = [cond.strip() for cond in value.split(';')]
     parsed_conditions = []
 
-    for condition in conditions:
-        if condition.startswith('IF'):
-            try:
-                parts = condition.replace('IF', '').split('THEN')
-                if len(parts) == 2:
-                    condition_part = parts[0].strip()
-                    result_part = parts[1].strip()
-                    parsed_conditions.append((condition_part, result_part))
-            except Exception as e:
-                log(LogLevel.ERROR, f"Error parsing condition: {condition}")
-                log(LogLevel.DEBUG, f"Error details: {str(e)}")
-                continue
+    for condition in value.split(';'):
+        match = RULE_PATTERN.match(condition.strip())
+        if match:
+            op_fn, threshold = compile_condition(match.group(1))
+            parsed_conditions.append((op_fn, threshold, match.group(2)))
 
     return parsed_conditions if parsed_conditions else value
 
 
-def safe_eval(condition, amount):
-    try:
-        condition = condition.strip()
-        operators = {
-            '>=': operator.ge,
-            '<=': operator.le,
-            '>': operator.gt,
-            '<': operator.lt,
-            '==': operator.eq,
-            '!=': operator.ne
-        }
+def compile_condition(condition):
+    """Turn an 'Amount <op> value' condition into an (op_fn, threshold) pair
 
+    Conditions written as 'value <op> Amount' are flipped so the amount is
+    always the left operand. A condition that cannot be parsed compiles to
+    (None, None) and never matches.
+    """
+    try:
         used_op = None
-        for op in operators:
+        for op in CONDITION_OPERATORS:
             if op in condition:
                 used_op = op
                 break
@@ -187,104 +314,219 @@ def safe_eval(condition, amount):
         left, right = [part.strip() for part in condition.split(used_op)]
 
         if left == 'Amount':
-            return operators[used_op](float(amount), float(right))
+            return CONDITION_OPERATORS[used_op], float(right)
         elif right == 'Amount':
-            return operators[used_op](float(left), float(amount))
+            return CONDITION_OPERATORS[FLIPPED_OPERATORS[used_op]], float(left)
 
         raise ValueError(f"Invalid condition format: {condition}")
 
     except Exception as e:
-        log(LogLevel.ERROR, f"Error evaluating condition: {condition}")
+        log(LogLevel.ERROR, f"Error compiling condition: {condition}")
         log(LogLevel.DEBUG, f"Error details: {str(e)}")
-        log(LogLevel.DEBUG, f"Amount value: {amount}, Type: {type(amount)}")
-        return False
+        return None, None
 
 
-def evaluate_conditional(conditions, amount):
+def evaluate_conditional(conditions, amounts):
+    """Evaluate compiled conditional rules for an array of amounts
+
+    Each amount gets the result of the first condition it satisfies, or the
+    last rule's result when none match.
+    """
     if not isinstance(conditions, list):
         return conditions
 
     try:
-        for condition, result in conditions:
-            if safe_eval(condition, amount):
-                return result
+        amounts = np.asarray(amounts, dtype=float)
+        condlist = [op_fn(amounts, threshold) if op_fn else np.zeros(amounts.shape, dtype=bool)
+                    for op_fn, threshold, _ in conditions]
+        choicelist = [result for _, _, result in conditions]
 
-        return conditions[-1][1] if conditions else None
+        return np.select(condlist, choicelist, default=conditions[-1][2])
 
     except Exception as e:
         log(LogLevel.ERROR, f"Error in evaluate_conditional: {str(e)}")
         log(LogLevel.DEBUG, f"Conditions: {conditions}")
-        log(LogLevel.DEBUG, f"Amount: {amount}")
+        log(LogLevel.DEBUG, f"Amounts: {amounts}")
         return None
 
 
-def standardize_merchant_name(merchant_name):
-    """Standardize merchant names for consistent mapping"""
-    if isinstance(merchant_name, str) and (merchant_name.startswith('Facebk') or merchant_name == 'Facebook'):
-        return 'Facebook'
-    return merchant_name
+def standardize_merchant_names(merchant_names):
+    """Standardize a column of merchant names for consistent mapping"""
+    is_facebook = merchant_names.str.startswith('Facebk', na=False) | merchant_names.eq('Facebook')
+    return pd.Series(np.where(is_facebook, 'Facebook', merchant_names),
+                     index=merchant_names.index, dtype=object)
 
 
-def create_upload_df(transaction_df, mapping_dict):
-    upload_rows = []
+def create_mapping_df(mapping_dict):
+    """Turn the mapping dict into a table that can be joined onto transactions"""
+    mapping_df = pd.DataFrame(list(mapping_dict.values()), columns=MAPPED_FIELDS + ['Include Memo'])
+    mapping_df.insert(0, 'Mapping Merchant Name', [key[0] for key in mapping_dict])
+    mapping_df.insert(1, 'Card Name', [key[1] for key in mapping_dict])
+    return mapping_df
 
-    for idx, trans_row in transaction_df.iterrows():
-        try:
-            standard_merchant_name = standardize_merchant_name(trans_row['Clean Merchant Name'])
-            key = (standard_merchant_name, trans_row['Card Name'])
-            mapped_values = mapping_dict.get(key)
-
-            new_row = {
-                'Date (UTC)': trans_row['Date (UTC)'],
-                'Amount': trans_row['Amount'],
-                'Clean Merchant Name': trans_row['Clean Merchant Name'],
-                'Card Name': trans_row['Card Name']
-            }
 
-            if mapped_values:
-                for field, value in mapped_values.items():
-                    if field in ['GL Name', 'GL Internal ID']:
-                        evaluated_value = evaluate_conditional(value, trans_row['Amount'])
-                        if evaluated_value is not None:
-                            new_row[field] = evaluated_value
-                        else:
-                            log(LogLevel.WARNING, f"No valid value found for {field} with amount {trans_row['Amount']}")
-                    elif field == 'Line Memo':
-                        line_memo = value
-                        if mapped_values.get('Include Memo') and trans_row.get('Memo'):
-                            line_memo = f"{line_memo} - {trans_row['Memo']}"
-                        new_row[field] = line_memo
-                    elif field != 'Include Memo':
-                        new_row[field] = value
-            else:
-                new_row['Needs Review'] = 'X'
-                new_row['Review Reason'] = f"No rules found for {trans_row['Clean Merchant Name']} in the mapping file."
+def align_key_categories(left_df, right_df, columns):
+    """Give both frames' join columns one shared categorical dtype so their codes line up"""
+    for col in columns:
+        categories = pd.Index(left_df[col].dropna().astype(object).unique()).union(
+            pd.Index(right_df[col].dropna().astype(object).unique()))
+        key_dtype = pd.CategoricalDtype(categories)
+        left_df[col] = left_df[col].astype(key_dtype)
+        right_df[col] = right_df[col].astype(key_dtype)
 
-                mapped_fields = ['Merchant Category', 'GL Name', 'GL Internal ID',
-                                 'Transaction Cost Center', 'Cost Center Internal ID',
-                                 'Customer Internal ID', 'Customer', 'Line Memo']
-                for field in mapped_fields:
-                    new_row[field] = None
 
-            upload_rows.append(new_row)
+def lookup_rule_ids(lookup_df, mapping_df):
+    """Row of mapping_df for each transaction, or -1 when no rule exists
 
-        except Exception as e:
-            log(LogLevel.ERROR, f"Error processing row {idx}: {str(e)}")
-            log(LogLevel.DEBUG, f"Row data: {trans_row}")
+    Both key columns must already share categorical dtypes; the two codes are
+    packed into one integer per row so the lookup hashes ints, not string tuples.
+    """
+    merchant_col, card_col = MERGE_KEYS
+    card_count = len(lookup_df[card_col].cat.categories)
+
+    def packed_codes(df):
+        merchant_codes = df[merchant_col].cat.codes.to_numpy(dtype=np.int64)
+        card_codes = df[card_col].cat.codes.to_numpy(dtype=np.int64)
+        return merchant_codes * card_count + card_codes, (merchant_codes >= 0) & (card_codes >= 0)
+
+    mapping_keys, mapping_has_key = packed_codes(mapping_df)
+    transaction_keys, has_key = packed_codes(lookup_df)
+
+    # A blank merchant or card has code -1, and its packed key would collide with
+    # a real (merchant, card) pair, so such mapping rows never match (as with the merge)
+    valid_rules = np.flatnonzero(mapping_has_key)
+    positions = pd.Index(mapping_keys[valid_rules]).get_indexer(transaction_keys)
+
+    rule_ids = np.full(len(transaction_keys), -1, dtype=np.int64)
+    found = has_key & (positions >= 0)
+    rule_ids[found] = valid_rules[positions[found]]
+    return rule_ids
+
+
+def compile_rule_tables(rules):
+    """Flatten compiled conditional rules into the arrays used by the numba kernel
+
+    rules is the per-mapping-row list of values for one conditional field; rows
+    whose value is not a rule list get a zero-length slot and keep their mapped
+    value.
+    """
+    rule_start = np.zeros(len(rules), dtype=np.int64)
+    rule_len = np.zeros(len(rules), dtype=np.int64)
+    op_codes, thresholds, result_ids, results = [], [], [], {}
+
+    for rule_id, conditions in enumerate(rules):
+        rule_start[rule_id] = len(op_codes)
+        if not isinstance(conditions, list):
             continue
+        rule_len[rule_id] = len(conditions)
+        for op_fn, threshold, result in conditions:
+            op_codes.append(RULE_OPERATOR_CODES.get(op_fn, -1))
+            thresholds.append(threshold if threshold is not None else np.nan)
+            result_ids.append(results.setdefault(result, len(results)))
+
+    result_values = np.empty(len(results), dtype=object)
+    for result, result_id in results.items():
+        result_values[result_id] = result
+
+    return (rule_start, rule_len, np.array(op_codes, dtype=np.int8),
+            np.array(thresholds, dtype=np.float64), np.array(result_ids, dtype=np.int64), result_values)
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _select_rule_results(amounts, rule_ids, rule_start, rule_len, op_codes, thresholds, result_ids):
+        """Index of the first matching rule result per transaction, -1 where no rule applies"""
+        out = np.full(amounts.shape[0], -1, dtype=np.int64)
+        for i in prange(amounts.shape[0]):
+            rule_id = rule_ids[i]
+            if rule_id < 0 or rule_len[rule_id] == 0:
+                continue
+            amount = amounts[i]
+            start = rule_start[rule_id]
+            end = start + rule_len[rule_id]
+            # Default to the last clause's result when nothing matches
+            out[i] = result_ids[end - 1]
+            for j in range(start, end):
+                op, threshold = op_codes[j], thresholds[j]
+                if ((op == 0 and amount > threshold) or (op == 1 and amount >= threshold)
+                        or (op == 2 and amount < threshold) or (op == 3 and amount <= threshold)
+                        or (op == 4 and amount == threshold) or (op == 5 and amount != threshold)):
+                    out[i] = result_ids[j]
+                    break
+        return out
 
-    upload_df = pd.DataFrame(upload_rows)
 
-    if 'Needs Review' in upload_df.columns:
-        regular_cols = [col for col in upload_df.columns if col not in ['Needs Review', 'Review Reason']]
-        final_cols = regular_cols + ['Needs Review', 'Review Reason']
-        upload_df = upload_df[final_cols]
+def create_upload_df(transaction_df, mapping_dict):
+    mapping_df = create_mapping_df(mapping_dict)
+
+    # Find every transaction's mapping rule in one pass
+    lookup_df = transaction_df.reset_index(drop=True).assign(**{
+        'Mapping Merchant Name': standardize_merchant_names(transaction_df['Clean Merchant Name']).to_numpy()
+    })
+    align_key_categories(lookup_df, mapping_df, MERGE_KEYS)
+    rule_ids = lookup_rule_ids(lookup_df, mapping_df)
+    matched = rule_ids >= 0
+
+    # Build each output column as an array and assemble the frame once at the end
+    columns = {col: lookup_df[col] for col in ['Date (UTC)', 'Amount', 'Clean Merchant Name', 'Card Name']}
+    for field in MAPPED_FIELDS:
+        columns[field] = np.full(len(lookup_df), np.nan, dtype=object)
+        columns[field][matched] = mapping_df[field].to_numpy(dtype=object)[rule_ids[matched]]
+
+    # Conditional GL fields: evaluate each rule once over all of its transactions
+    amounts = lookup_df['Amount'].to_numpy(dtype=float)
+    use_numba = NUMBA_AVAILABLE and len(lookup_df) >= NUMBA_MIN_ROWS
+    for field in CONDITIONAL_FIELDS:
+        if use_numba:
+            rule_start, rule_len, op_codes, thresholds, result_ids, result_values = compile_rule_tables(
+                mapping_df[field].tolist())
+            selected = _select_rule_results(amounts, rule_ids.astype(np.int64),
+                                            rule_start, rule_len, op_codes, thresholds, result_ids)
+            has_result = selected >= 0
+            columns[field][has_result] = result_values[selected[has_result]]
+            continue
+
+        for rule_id, conditions in enumerate(mapping_df[field]):
+            if not isinstance(conditions, list):
+                continue
 
-    return upload_df
+            rule_mask = rule_ids == rule_id
+            if not rule_mask.any():
+                continue
+
+            evaluated = evaluate_conditional(conditions, amounts[rule_mask])
+            if evaluated is not None:
+                columns[field][rule_mask] = evaluated
+            else:
+                columns[field][rule_mask] = None
+                log(LogLevel.WARNING, f"No valid value found for {field} with rule {conditions}")
+
+    # Append the transaction memo to the line memo where the rule asks for it
+    memo = lookup_df['Memo'].fillna('').astype(str).to_numpy()
+    include_memo = np.zeros(len(lookup_df), dtype=bool)
+    include_memo[matched] = mapping_df['Include Memo'].to_numpy(dtype=bool)[rule_ids[matched]]
+    memo_mask = include_memo & (memo != '')
+    if memo_mask.any():
+        line_memo = columns['Line Memo']
+        line_memo[memo_mask] = np.char.add(np.char.add(line_memo[memo_mask].astype(str), ' - '),
+                                           memo[memo_mask].astype(str))
+
+    # Flag transactions without a mapping rule for review
+    if not matched.all():
+        columns['Needs Review'] = np.where(matched, '', 'X')
+        columns['Review Reason'] = np.where(
+            matched,
+            '',
+            'No rules found for ' + lookup_df['Clean Merchant Name'].astype(str) + ' in the mapping file.'
+        )
+
+    # Mapped fields were filled as object arrays; let pandas narrow numeric ones again
+    return pd.DataFrame(columns).infer_objects()
 
 
 def process_summit_storage(upload_df):
-    summit_count = len(upload_df[upload_df['Merchant Name'] == 'Summit Self Storage'])
+    summit_mask = upload_df['Merchant Name'] == 'Summit Self Storage'
+    summit_count = int(summit_mask.sum())
 
     if summit_count != 3:
         if 'Needs Review' not in upload_df.columns:
@@ -292,12 +534,11 @@ def process_summit_storage(upload_df):
         if 'Review Reason' not in upload_df.columns:
             upload_df['Review Reason'] = ''
 
-        summit_mask = upload_df['Merchant Name'] == 'Summit Self Storage'
         upload_df.loc[summit_mask, 'Needs Review'] = 'X'
         upload_df.loc[
             summit_mask, 'Review Reason'] = f'There are {summit_count} charges for Summit Self Storage. There should be exactly 3.'
     else:
-        summit_indices = upload_df[upload_df['Merchant Name'] == 'Summit Self Storage'].index.tolist()
+        summit_indices = upload_df.index[summit_mask.to_numpy()].tolist()
         random.shuffle(summit_indices)
 
         department_mappings = [
@@ -306,9 +547,9 @@ def process_summit_storage(upload_df):
             ('Marketing : Shopper Marketing', 24)
         ]
 
-        for idx, (dept, dept_id) in zip(summit_indices, department_mappings):
-            upload_df.loc[idx, 'Department'] = dept
-            upload_df.loc[idx, 'Department Internal ID'] = dept_id
+        depts, dept_ids = zip(*department_mappings)
+        upload_df.loc[summit_indices, 'Department'] = list(depts)
+        upload_df.loc[summit_indices, 'Department Internal ID'] = list(dept_ids)
 
     return upload_df
 
@@ -328,8 +569,13 @@ def main(resume_state=None):
         if resume_state:
             log(LogLevel.INFO, "Resuming from saved state...")
 
-            # Load state
-            upload_df = pd.read_excel(resume_state.upload_template_file)
+            # Only re-parse the workbook if it was edited during review
+            template_mtime = os.path.getmtime(resume_state.upload_template_file)
+            if resume_state.upload_df is not None and template_mtime == resume_state.upload_template_mtime:
+                log(LogLevel.INFO, "Review file was not modified, using saved data")
+                upload_df = resume_state.upload_df
+            else:
+                upload_df = pd.read_excel(resume_state.upload_template_file, engine='openpyxl')
             csv_upload_base_folder = resume_state.csv_upload_base_folder
 
             # Jump to phase 2
@@ -374,34 +620,40 @@ def main(resume_state=None):
         transaction_df = pd.read_csv(
             transaction_file,
             usecols=use_columns,
-            thousands=',',
-            converters={'Amount': lambda x: float(x.strip('$()').replace(',', '')) * -1}
+            dtype={'Amount': str},
+            engine=CSV_ENGINE
         )
 
-        transaction_df['Amount'] = pd.to_numeric(transaction_df['Amount'], errors='coerce')
-        transaction_df['Date (UTC)'] = pd.to_datetime(transaction_df['Date (UTC)']).dt.strftime('%m/%d/%Y')
+        # Strip currency formatting and flip the sign in one vectorized pass
+        amount_text = transaction_df['Amount'].str.replace(r'[\s$(),]', '', regex=True)
+        transaction_df['Amount'] = -pd.to_numeric(amount_text, errors='coerce')
+        transaction_df['Date (UTC)'] = pd.to_datetime(transaction_df['Date (UTC)'])
+        for col in CATEGORICAL_COLUMNS:
+            transaction_df[col] = transaction_df[col].astype('category')
+        log(LogLevel.DEBUG, f"Transaction data memory usage: {transaction_df.memory_usage(deep=True).sum():,} bytes")
 
         if 'Memo' not in transaction_df.columns:
             transaction_df['Memo'] = ''
 
-        # Remove Accounts Payable transactions
-        ap_rows = transaction_df[transaction_df['Card Name'] == 'Accounts Payable'].copy()
-        if not ap_rows.empty:
-            log(LogLevel.INFO, f"Removing {len(ap_rows)} Accounts Payable transactions")
-            log(LogLevel.DEBUG, f"Total value of removed AP transactions: ${abs(ap_rows['Amount'].sum()):,.2f}")
-            transaction_df = transaction_df[transaction_df['Card Name'] != 'Accounts Payable'].copy()
+        # Remove Accounts Payable and negative amount transactions in a single pass
+        ap_mask = transaction_df['Card Name'] == 'Accounts Payable'
+        negative_mask = ~ap_mask & (transaction_df['Amount'] < 0)
+
+        ap_count = ap_mask.sum()
+        if ap_count:
+            log(LogLevel.INFO, f"Removing {ap_count} Accounts Payable transactions")
+            log(LogLevel.DEBUG, f"Total value of removed AP transactions: ${abs(transaction_df.loc[ap_mask, 'Amount'].sum()):,.2f}")
 
-        # Remove negative amount transactions
-        negative_rows = transaction_df[transaction_df['Amount'] < 0].copy()
-        if not negative_rows.empty:
-            log(LogLevel.INFO, f"Removing {len(negative_rows)} transactions with negative amounts")
-            log(LogLevel.DEBUG, f"Total value of removed negative transactions: ${negative_rows['Amount'].sum():,.2f}")
-            transaction_df = transaction_df[transaction_df['Amount'] >= 0].copy()
+        negative_count = negative_mask.sum()
+        if negative_count:
+            log(LogLevel.INFO, f"Removing {negative_count} transactions with negative amounts")
+            log(LogLevel.DEBUG, f"Total value of removed negative transactions: ${transaction_df.loc[negative_mask, 'Amount'].sum():,.2f}")
+
+        transaction_df = transaction_df.loc[~ap_mask & (transaction_df['Amount'] >= 0)].copy()
 
         # Read mapping file and process
         log(LogLevel.INFO, "Loading transaction mapping...")
-        transaction_mapping_df = pd.read_csv(transaction_mapping_file)
-        mapping_dict = create_mapping_dict(transaction_mapping_df)
+        mapping_dict = load_mapping_dict(transaction_mapping_file)
 
         # Create upload DataFrame
         log(LogLevel.INFO, "Creating upload data...")
@@ -420,14 +672,15 @@ def main(resume_state=None):
         upload_df.reset_index(drop=True, inplace=True)
 
         # Create NS Transaction IDs
-        dates_dt = pd.to_datetime(upload_df['Date'])
+        # Dates stay datetime64 until here and are formatted once for the review file
+        dates_dt = upload_df['Date']
         date_prefix = dates_dt.dt.strftime('%y%m')
-        row_suffix = (upload_df.index + 1).map(lambda x: f'{x:05d}')
+        upload_df['Date'] = dates_dt.dt.strftime('%m/%d/%Y')
+        row_suffix = np.char.zfill(np.arange(1, len(upload_df) + 1).astype(str), 5)
         upload_df['NS Transaction'] = date_prefix + row_suffix
 
         # Reorder columns
-        cols = ['Vendor Internal ID', 'NS Transaction'] + [col for col in upload_df.columns if
-                                                           col not in ['Vendor Internal ID', 'NS Transaction']]
+        cols = list(dict.fromkeys(['Vendor Internal ID', 'NS Transaction', *upload_df.columns]))
         upload_df = upload_df[cols]
 
         # Drop Merchant Category if it exists
@@ -440,6 +693,7 @@ def main(resume_state=None):
         # Save to Excel for review
         log(LogLevel.INFO, "Saving data to Excel template for review...")
         upload_df.to_excel(upload_template_file, sheet_name='MVP Logistics', index=False)
+        upload_template_mtime = os.path.getmtime(upload_template_file)
 
         # Open the file for review
         log(LogLevel.INFO, "Opening Excel file for review...")
@@ -450,6 +704,7 @@ def main(resume_state=None):
         state.upload_df = upload_df
         state.csv_upload_base_folder = csv_upload_base_folder
         state.upload_template_file = upload_template_file
+        state.upload_template_mtime = upload_template_mtime
         state.phase = 'review'
 
         log(LogLevel.INFO,
@@ -468,12 +723,12 @@ def complete_processing(upload_df, csv_upload_base_folder):
     try:
         log(LogLevel.INFO, "Continuing with processing after review...")
 
-        # Create the primary upload DataFrame
-        primary_upload_df = upload_df[[
+        # Columns included in the primary upload file
+        primary_upload_columns = [
             'Vendor Internal ID', 'NS Transaction', 'Date', 'Amount',
             'GL Name', 'GL Internal ID', 'Department', 'Department Internal ID',
             'Customer Internal ID', 'Customer', 'Line Memo'
-        ]].copy()
+        ]
 
         # Create save path based on current date
         current_date = datetime.now()
@@ -486,7 +741,9 @@ def complete_processing(upload_df, csv_upload_base_folder):
 
         # Save the CSV file
         primary_csv_path = os.path.join(save_path, f"{month} Divvy Upload.csv")
-        primary_upload_df.to_csv(primary_csv_path, index=False)
+        # Write the columns straight from upload_df; quoting stays minimal since
+        # customer names and memos can contain commas
+        upload_df.to_csv(primary_csv_path, columns=primary_upload_columns, index=False, lineterminator='\n')
 
         log(LogLevel.SUCCESS, f"File saved successfully: {primary_csv_path}")
         log(LogLevel.INFO, "=" * 80)
@@ -504,14 +761,14 @@ if __name__ == "__main__":
     # Check if this is a resume operation
     if len(sys.argv) > 1 and sys.argv[1] == "--resume":
         # Load saved state
-        state_file = os.path.join(os.path.dirname(__file__), ".divvy_state.pkl")
+        state_file = os.path.join(os.path.dirname(__file__), ".divvy_state.json")
         if os.path.exists(state_file):
             try:
                 saved_state = ScriptState.load(state_file)
                 exit_code, _ = main(resume_state=saved_state)
                 # Clean up state file after successful completion
                 if exit_code == 0:
-                    os.remove(state_file)
+                    ScriptState.remove(state_file)
                 sys.exit(exit_code)
             except Exception as e:
                 log(LogLevel.ERROR, f"Failed to load saved state: {str(e)}")
@@ -525,7 +782,7 @@ if __name__ == "__main__":
 
         # If paused, save state
         if exit_code == 99 and state:
-            state_file = os.path.join(os.path.dirname(__file__), ".divvy_state.pkl")
+            state_file = os.path.join(os.path.dirname(__file__), ".divvy_state.json")
             state.save(state_file)
 
         sys.exit(exit_code)
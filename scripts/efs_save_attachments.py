@@ -6,33 +6,86 @@ Saves email attachments from selected Outlook emails to Element Food Solutions f
 
 import sys
 import os
-import pythoncom
-import win32com.client
-import psutil
-from win32com.client import Dispatch, gencache
 from datetime import datetime
 import json
-import pdfplumber
 import re
 from io import BytesIO
-import shutil
-import glob
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from pypdf import PdfReader
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
 import logging # <<< ADD THIS IMPORT
+from _common_paths import find_path_with_components, is_outlook_open
 
+# Upper bound on worker processes used to parse PDFs in parallel
+MAX_PDF_WORKERS = 8
 
-class LogLevel:
-    DEBUG = "[DEBUG]"
-    INFO = "[INFO]"
-    SUCCESS = "[SUCCESS]"
-    WARNING = "[WARNING]"
-    ERROR = "[ERROR]"
+# MAPI property holding an attachment's raw contents
+PR_ATTACH_DATA_BIN = "http://schemas.microsoft.com/mapi/proptag/0x37010102"
 
+# Invoice header as it appears in EFS PDFs, e.g.
+# "United States 160-125001578 5/16/25 6/16/25"
+INVOICE_HEADER_PATTERN = re.compile(
+    r"United\s+States\s+(\d{3}-\d{9})\s+(\d{1,2}/\d{1,2}/\d{2,4})",
+    re.DOTALL
+)
+
+# Invoice number and date that appear after the headers with text in between
+INVOICE_LAYOUT_PATTERN = re.compile(
+    r"INVOICE\s+#\s+INVOICE\s+Date.*?(\d{3}-\d{9})\s+(\d{1,2}/\d{1,2}/\d{2,4})",
+    re.DOTALL | re.IGNORECASE
+)
+
+# Fallback invoice number patterns, tried in order so an "Invoice #" label wins
+# over an "Invoice Number" label that appears earlier in the text
+INVOICE_NUMBER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r"INVOICE\s*#[:\s]*(\d{3}-\d{9})",
+    r"INVOICE\s*NUMBER[:\s]*(\d{3}-\d{9})"
+])
+
+# Fallback date patterns, tried in order so an "Invoice Date" label wins over
+# any other date (e.g. a due date) that appears earlier in the text
+INVOICE_DATE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r"INVOICE\s*Date[:\s]*(\d{1,2}/\d{1,2}/\d{2,4})",
+    r"DATE[:\s]*(\d{1,2}/\d{1,2}/\d{2,4})"
+])
+
+# Accepted invoice date formats once '-' separators are normalized to '/'
+INVOICE_DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y")
+
+
+# Extra level between INFO and WARNING, shown as [SUCCESS] in the console
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
+
+
+def setup_logger():
+    """Create the script logger.
+
+    Lines keep the "<timestamp> [LEVEL] message" shape the script runner parses,
+    and messages are only formatted when their level is enabled. DEBUG is on by
+    default because the console decides what to show; set EFS_LOG to raise it.
+    """
+    # Line buffering keeps output streaming to the console without a flush per call
+    sys.stdout.reconfigure(line_buffering=True)
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
+
+    script_logger = logging.getLogger("efs")
+    script_logger.addHandler(handler)
+    script_logger.setLevel(os.environ.get("EFS_LOG", "DEBUG").upper())
+    # Keep pdfminer and other library loggers out of the script output
+    script_logger.propagate = False
+    return script_logger
+
+
+logger = setup_logger()
 
-def log(level, message):
-    """Print a log message with timestamp and level"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"{timestamp} {level} {message}")
-    sys.stdout.flush()  # Force immediate output
 
 class CropBoxFilter(logging.Filter):
     def filter(self, record):
@@ -41,6 +94,13 @@ class CropBoxFilter(logging.Filter):
         return "CropBox missing from /Page, defaulting to MediaBox" not in record.getMessage()
 
 
+def install_pdfminer_log_filter():
+    """Silence pdfminer's CropBox warnings (also used as the PDF worker initializer)."""
+    pdfminer_logger = logging.getLogger('pdfminer.pdfpage')
+    pdfminer_logger.addFilter(CropBoxFilter())
+
+
+@functools.lru_cache(maxsize=None)
 def load_script_settings():
     """Load saved path configurations for this script"""
     settings_file = os.path.join("config", "script_settings", "efs_attachments_saver_settings.json")
@@ -49,91 +109,15 @@ def load_script_settings():
         try:
             with open(settings_file, 'r') as f:
                 settings = json.load(f)
-                log(LogLevel.DEBUG, f"Loaded custom path configurations from {settings_file}")
+                logger.debug("Loaded custom path configurations from %s", settings_file)
                 return settings
         except Exception as e:
-            log(LogLevel.WARNING, f"Failed to load settings file: {e}")
+            logger.warning("Failed to load settings file: %s", e)
 
     return {}
 
 
-def find_path_with_components(folder_components):
-    """Find a path containing the specified folder components."""
-    log(LogLevel.DEBUG, f"Searching for path with components: {folder_components}")
-
-    home_dir = os.path.expanduser('~')
-    # Define all possible base directories
-    possible_bases = [
-        os.path.join(home_dir, 'Kodiak Cakes'),
-        os.path.join(home_dir, 'OneDrive - Kodiak Cakes')
-    ]
-
-    # Define possible entry points from each base
-    possible_entry_points = [
-        ['Kodiak Cakes Team Site - Public'],
-        ['Kodiak Cakes Team Site - Accounting', 'Public'],
-        ['']  # Empty entry point for direct access
-    ]
-
-    for base in possible_bases:
-        log(LogLevel.DEBUG, f"Checking base directory: {base}")
-        if not os.path.exists(base):
-            log(LogLevel.DEBUG, f"Base directory does not exist: {base}")
-            continue
-
-        for entry_point in possible_entry_points:
-            current_path = base
-            for entry in entry_point:
-                if entry:  # Skip empty entry
-                    test_path = os.path.join(current_path, entry)
-                    if not os.path.exists(test_path):
-                        break
-                    current_path = test_path
-
-            result = find_components_flexible(current_path, folder_components)
-            if result:
-                log(LogLevel.DEBUG, f"Found valid path: {result}")
-                return result
-
-    log(LogLevel.DEBUG, "No valid path found")
-    return None
-
-
-def find_components_flexible(start_path, components, depth=0, max_depth=3):
-    """Recursively find folder components with flexible matching."""
-    if depth > max_depth:
-        return None
-    if not components:
-        return start_path
-
-    next_component = components[0]
-    direct_path = os.path.join(start_path, next_component)
-
-    if os.path.exists(direct_path):
-        result = find_components_flexible(direct_path, components[1:], depth, max_depth)
-        if result:
-            return result
-
-    try:
-        for item in os.listdir(start_path):
-            item_path = os.path.join(start_path, item)
-            if os.path.isdir(item_path):
-                if item.startswith('.'):
-                    continue
-                if item == next_component:
-                    result = find_components_flexible(item_path, components[1:], depth, max_depth)
-                    if result:
-                        return result
-                result = find_components_flexible(item_path, components, depth + 1, max_depth)
-                if result:
-                    return result
-    except (PermissionError, FileNotFoundError) as e:
-        log(LogLevel.DEBUG, f"Access denied or file not found: {e}")
-        pass
-
-    return None
-
-
+@functools.lru_cache(maxsize=None)
 def get_folder_path(components, settings_key=None):
     """Get the full path for the specified folder components, checking settings first."""
     # Check if we have a configured path for this key
@@ -142,120 +126,174 @@ def get_folder_path(components, settings_key=None):
         configured_path = settings.get(settings_key)
 
         if configured_path and os.path.exists(configured_path):
-            log(LogLevel.INFO, f"Using configured path for {settings_key}: {configured_path}")
+            logger.info("Using configured path for %s: %s", settings_key, configured_path)
             return configured_path
         elif configured_path:
-            log(LogLevel.WARNING, f"Configured path for {settings_key} does not exist: {configured_path}")
+            logger.warning("Configured path for %s does not exist: %s", settings_key, configured_path)
 
     # Fall back to default path discovery
-    path = find_path_with_components(components)
+    path = find_path_with_components(components, log_debug=logger.debug)
     if not path:
-        log(LogLevel.ERROR, f"Could not find a valid path containing the components: {components}")
+        logger.error("Could not find a valid path containing the components: %s", components)
         return None
     return path
 
 
 def get_od_invoice_folder_path():
     """Get path to the Element Food Solutions main folder."""
-    folder_components = ['Waffle-Dry', 'Element Food Solutions']
+    folder_components = ('Waffle-Dry', 'Element Food Solutions')
     return get_folder_path(folder_components, 'od_invoice_folder')
 
 
 def get_invoice_folder_path():
     """Get path to the Element Food Solutions data imports folder."""
-    folder_components = ['Waffle-Dry', 'Element Food Solutions', 'Data Imports']
+    folder_components = ('Waffle-Dry', 'Element Food Solutions', 'Data Imports')
     return get_folder_path(folder_components, 'data_imports_folder')
 
 
-def is_outlook_open():
-    """Check if Outlook is currently running."""
-    log(LogLevel.DEBUG, "Checking if Outlook is running...")
-    for process in psutil.process_iter(['name']):
-        if process.info['name'] == "OUTLOOK.EXE":
-            log(LogLevel.DEBUG, "Outlook process found")
-            return True
-    log(LogLevel.DEBUG, "Outlook process not found")
-    return False
+def read_attachment_bytes(attachment, temp_file_path):
+    """Read an Outlook attachment's contents straight from MAPI.
+
+    Falls back to a SaveAsFile round-trip through temp_file_path when the
+    binary property is not available (e.g. very large attachments).
+    """
+    try:
+        return bytes(attachment.PropertyAccessor.GetProperty(PR_ATTACH_DATA_BIN))
+    except Exception as e:
+        logger.debug("Could not read attachment data from MAPI, using a temporary file: %s", e)
+
+    attachment.SaveAsFile(temp_file_path)
+    try:
+        with open(temp_file_path, 'rb') as file:
+            return file.read()
+    finally:
+        os.remove(temp_file_path)
+
+
+def write_pdf_file(file_path, pdf_file_bytes):
+    """Write PDF bytes to disk in a single buffered write."""
+    with open(file_path, 'wb', buffering=1 << 20) as file:
+        file.write(pdf_file_bytes)
 
 
-def extract_text_from_pdf(pdf_file_bytes):
-    """Extract text from PDF bytes using pdfplumber."""
-    text = ''
+def iter_pdf_page_texts(pdf_file_bytes):
+    """Yield the text of each PDF page in order.
+
+    Uses pypdf's lightweight text extraction when it is installed; pdfplumber
+    builds character/layout tables we don't need, so it is only the fallback.
+    """
+    if PYPDF_AVAILABLE:
+        reader = PdfReader(BytesIO(pdf_file_bytes))
+        for page in reader.pages:
+            yield page.extract_text() or ""
+        return
+
+    # pdfplumber drags in pdfminer and PIL, so only import it when it's needed
+    import pdfplumber
+
+    with pdfplumber.open(BytesIO(pdf_file_bytes)) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ""
+
+
+def extract_invoice_from_pdf(pdf_file_bytes):
+    """Extract invoice data from PDF bytes, reading pages only until it is found.
+
+    The invoice number and date are normally on page 1, so each page is checked
+    as it is extracted; the whole document is only searched if no single page
+    has both fields.
+    """
+    page_texts = []
+    invoice_data = {}
     try:
-        with pdfplumber.open(BytesIO(pdf_file_bytes)) as pdf:
-            for page in pdf.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text += extracted
-        return text
+        for extracted in iter_pdf_page_texts(pdf_file_bytes):
+            if not extracted:
+                continue
+            page_texts.append(extracted)
+            invoice_data = extract_invoice_data(extracted)
+            if invoice_data.get("Invoice") and invoice_data.get("Invoice Date"):
+                return invoice_data
     except Exception as e:
-        log(LogLevel.ERROR, f"Failed to extract text from PDF during processing: {str(e)}")
+        logger.error("Failed to extract text from PDF during processing: %s", str(e))
         raise Exception(f"Failed to extract text from PDF: {str(e)}")
 
+    if len(page_texts) <= 1:
+        return invoice_data
+    # Fields may be split across pages
+    return extract_invoice_data("".join(page_texts))
+
+
+def extract_invoices_from_pdfs(pdf_blobs):
+    """Extract invoice data from several PDFs, returning the data or the raised exception for each.
+
+    pdfplumber is pure Python, so multiple PDFs are parsed in worker processes;
+    a single PDF is parsed inline to avoid the process start-up cost.
+    """
+    if len(pdf_blobs) < 2:
+        results = []
+        for pdf_file_bytes in pdf_blobs:
+            try:
+                results.append(extract_invoice_from_pdf(pdf_file_bytes))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    max_workers = min(MAX_PDF_WORKERS, os.cpu_count() or 1, len(pdf_blobs))
+    logger.debug("Extracting invoice data from %s PDFs with %s worker processes", len(pdf_blobs), max_workers)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=install_pdfminer_log_filter) as executor:
+        futures = [executor.submit(extract_invoice_from_pdf, pdf_file_bytes) for pdf_file_bytes in pdf_blobs]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+    return results
+
 
 def extract_invoice_data(text):
     """Extract invoice number and date from PDF text."""
     extracted_data = {}
 
     # Debug: Log first 500 characters to see what we're working with
-    debug_text = text[:500].replace('\n', '\\n')
-    log(LogLevel.DEBUG, f"First 500 chars of PDF text: {debug_text}")
+    if logger.isEnabledFor(logging.DEBUG):
+        debug_text = text[:500].replace('\n', '\\n')
+        logger.debug("First 500 chars of PDF text: %s", debug_text)
 
-    # Pattern to match the specific format we see in the debug output:
-    # "United States 160-125001578 5/16/25 6/16/25"
-    specific_pattern = re.search(
-        r"United\s+States\s+(\d{3}-\d{9})\s+(\d{1,2}/\d{1,2}/\d{2,4})",
-        text,
-        re.DOTALL
-    )
+    # Pattern to match the specific format we see in the debug output
+    specific_pattern = INVOICE_HEADER_PATTERN.search(text)
 
     if specific_pattern:
         extracted_data["Invoice"] = specific_pattern.group(1).strip()
         extracted_data["Invoice Date"] = specific_pattern.group(2).strip()
-        log(LogLevel.DEBUG, f"Found using specific pattern: Invoice: {extracted_data['Invoice']}, Date: {extracted_data['Invoice Date']}")
+        logger.debug("Found using specific pattern: Invoice: %s, Date: %s", extracted_data['Invoice'], extracted_data['Invoice Date'])
         return extracted_data
 
     # Pattern to match invoice number and date that appear after the headers with text in between
-    layout_pattern = re.search(
-        r"INVOICE\s+#\s+INVOICE\s+Date.*?(\d{3}-\d{9})\s+(\d{1,2}/\d{1,2}/\d{2,4})",
-        text,
-        re.DOTALL | re.IGNORECASE
-    )
+    layout_pattern = INVOICE_LAYOUT_PATTERN.search(text)
 
     if layout_pattern:
         extracted_data["Invoice"] = layout_pattern.group(1).strip()
         extracted_data["Invoice Date"] = layout_pattern.group(2).strip()
-        log(LogLevel.DEBUG, f"Found using layout pattern: Invoice: {extracted_data['Invoice']}, Date: {extracted_data['Invoice Date']}")
+        logger.debug("Found using layout pattern: Invoice: %s, Date: %s", extracted_data['Invoice'], extracted_data['Invoice Date'])
         return extracted_data
 
     # If still not found, try more general patterns
     # Try to find invoice number using more flexible patterns
-    invoice_patterns = [
-        r"INVOICE\s*#\s*[:\s]*(\d{3}-\d{9})",
-        r"INVOICE\s*NUMBER[:\s]*(\d{3}-\d{9})",
-        r"Invoice\s*#[:\s]*(\d{3}-\d{9})",
-        r"Invoice\s*Number[:\s]*(\d{3}-\d{9})"
-    ]
-
-    for pattern in invoice_patterns:
-        invoice_match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in INVOICE_NUMBER_PATTERNS:
+        invoice_match = pattern.search(text)
         if invoice_match:
             extracted_data["Invoice"] = invoice_match.group(1).strip()
-            log(LogLevel.DEBUG, f"Found invoice number: {extracted_data['Invoice']} using pattern: {pattern}")
+            logger.debug("Found invoice number: %s using pattern: %s", extracted_data['Invoice'], pattern.pattern)
             break
 
     # Try to find date using more flexible patterns
-    date_patterns = [
-        r"INVOICE\s*Date[:\s]*(\d{1,2}/\d{1,2}/\d{2,4})",
-        r"DATE[:\s]*(\d{1,2}/\d{1,2}/\d{2,4})",
-        r"Date[:\s]*(\d{1,2}/\d{1,2}/\d{2,4})"
-    ]
-
-    for pattern in date_patterns:
-        date_match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in INVOICE_DATE_PATTERNS:
+        date_match = pattern.search(text)
         if date_match:
             extracted_data["Invoice Date"] = date_match.group(1).strip()
-            log(LogLevel.DEBUG, f"Found date: {extracted_data['Invoice Date']} using pattern: {pattern}")
+            logger.debug("Found date: %s using pattern: %s", extracted_data['Invoice Date'], pattern.pattern)
             break
 
     return extracted_data
@@ -263,11 +301,15 @@ def extract_invoice_data(text):
 
 def save_attachments_from_selected_emails(invoice_folder, od_invoice_folder):
     """Save attachments from selected emails in Outlook to the specified folders."""
-    log(LogLevel.DEBUG, "Initializing COM library for Outlook integration...")
+    import pythoncom
+    import win32com.client
+    from win32com.client import Dispatch, gencache
+
+    logger.debug("Initializing COM library for Outlook integration...")
     pythoncom.CoInitialize()  # Initialize COM library
 
     try:
-        log(LogLevel.INFO, "Connecting to Outlook application...")
+        logger.info("Connecting to Outlook application...")
         outlook = Dispatch("Outlook.Application")
         gencache.EnsureDispatch(outlook.Application)
         namespace = outlook.GetNamespace("MAPI")
@@ -275,154 +317,157 @@ def save_attachments_from_selected_emails(invoice_folder, od_invoice_folder):
         selection = explorer.Selection
 
         if not selection:
-            log(LogLevel.WARNING, "No emails selected in Outlook")
+            logger.warning("No emails selected in Outlook")
             return 0
 
-        log(LogLevel.INFO, f"Found {len(selection)} selected email(s)")
+        selection_count = selection.Count
+        logger.info("Found %s selected email(s)", selection_count)
 
         # Clean up existing PDFs in data imports folder
-        log(LogLevel.INFO, "Cleaning up existing PDF files in data imports folder...")
-        pdf_files = glob.glob(os.path.join(invoice_folder, '*.pdf'))
-        for pdf_file in pdf_files:
-            try:
-                os.remove(pdf_file)
-                log(LogLevel.DEBUG, f"Deleted existing PDF: {pdf_file}")
-            except Exception as e:
-                log(LogLevel.WARNING, f"Error deleting {pdf_file}: {e}")
+        logger.info("Cleaning up existing PDF files in data imports folder...")
+        with os.scandir(invoice_folder) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith('.pdf'):
+                    try:
+                        os.unlink(entry.path)
+                        logger.debug("Deleted existing PDF: %s", entry.path)
+                    except OSError as e:
+                        logger.warning("Error deleting %s: %s", entry.path, e)
 
         saved_count = 0
         total_attachments = 0
         saved_files = []
 
+        # Collect PDF attachments first; COM objects must stay on this thread
+        pdf_jobs = []
+        ol_mail = win32com.client.constants.olMail
         for i, item in enumerate(selection, 1):
-            log(LogLevel.DEBUG, f"Processing email {i}/{len(selection)}")
+            logger.debug("Processing email %s/%s", i, selection_count)
 
-            if item.Class == win32com.client.constants.olMail:
+            if item.Class == ol_mail:
                 email_subject = getattr(item, 'Subject', 'No Subject')
-                log(LogLevel.INFO, f"Processing email: {email_subject[:50]}...")
+                logger.info("Processing email: %s...", email_subject[:50])
 
-                if item.Attachments.Count == 0:
-                    log(LogLevel.DEBUG, f"No attachments found in email: {email_subject[:30]}...")
+                attachments = item.Attachments
+                if attachments.Count == 0:
+                    logger.debug("No attachments found in email: %s...", email_subject[:30])
                     continue
 
-                for attachment in item.Attachments:
+                for attachment in attachments:
                     total_attachments += 1
                     attachment_name = attachment.FileName
 
                     # Check if the file is a PDF based on extension
                     file_extension = os.path.splitext(attachment_name)[1].lower()
                     if file_extension != '.pdf':
-                        log(LogLevel.DEBUG, f"Skipping non-PDF attachment: {attachment_name}")
+                        logger.debug("Skipping non-PDF attachment: %s", attachment_name)
                         continue
 
-                    # Save the attachment to a temporary file
+                    # Fallback location when the invoice can't be filed by date
                     temp_file_path = os.path.join(od_invoice_folder, attachment_name)
 
                     try:
-                        attachment.SaveAsFile(temp_file_path)
-                        log(LogLevel.DEBUG, f"Saved temporary file: {temp_file_path}")
-
-                        # Read the temporary file as bytes
-                        with open(temp_file_path, 'rb') as file:
-                            pdf_file_bytes = file.read()
-
-                        # Try to extract text and process the PDF
-                        try:
-                            pdf_text = extract_text_from_pdf(pdf_file_bytes)
-
-                            # Extract invoice data (date and invoice number)
-                            invoice_data = extract_invoice_data(pdf_text)
-
-                            invoice_date = invoice_data.get("Invoice Date")
-                            invoice_number = invoice_data.get("Invoice")
-
-                            if not invoice_number:
-                                log(LogLevel.WARNING, f"Invoice number not found in email '{email_subject}'. Using original filename.")
-                                invoice_number = os.path.splitext(attachment_name)[0]
-                            else:
-                                # Remove the "-IN" suffix from invoice numbers if present
-                                if invoice_number.endswith("-IN"):
-                                    invoice_number = invoice_number[:-3]  # Remove the last 3 characters ("-IN")
-
-                            # Generate filename with invoice number
-                            new_filename = f"{invoice_number}{file_extension}"
-
-                            if invoice_date:
-                                try:
-                                    # Try multiple date formats
-                                    for date_format in ["%m/%d/%Y", "%m/%d/%y", "%m-%d-%Y", "%m-%d-%y"]:
-                                        try:
-                                            due_date = datetime.strptime(invoice_date, date_format)
-                                            break
-                                        except ValueError:
-                                            continue
-                                    else:
-                                        # If none of the formats worked, raise an exception
-                                        raise ValueError(f"Could not parse date: {invoice_date}")
-
-                                    year_folder = os.path.join(od_invoice_folder, str(due_date.year))
-                                    month_folder = os.path.join(year_folder, f"{due_date.strftime('%m')} - {due_date.year}")
-
-                                    # Create year and month folders if they don't exist
-                                    if not os.path.exists(year_folder):
-                                        os.makedirs(year_folder)
-                                    if not os.path.exists(month_folder):
-                                        os.makedirs(month_folder)
-
-                                    # Move the temporary file to the correct folder with new filename
-                                    final_file_path = os.path.join(month_folder, new_filename)
-                                    shutil.move(temp_file_path, final_file_path)
-                                    saved_files.append(final_file_path)
-                                    log(LogLevel.DEBUG, f"Saved invoice to organized folder: {final_file_path}")
-
-                                    # Save the file to the additional folder with new filename
-                                    additional_file_path = os.path.join(invoice_folder, new_filename)
-                                    shutil.copy(final_file_path, additional_file_path)
-                                    log(LogLevel.DEBUG, f"Copied invoice to data imports: {additional_file_path}")
-
-                                    saved_count += 1
-
-                                except ValueError as e:
-                                    log(LogLevel.WARNING, f"Invalid date format in email '{email_subject}': {e}")
-                                    log(LogLevel.INFO, f"Saved to temporary folder: {temp_file_path}")
-                                    saved_files.append(temp_file_path)
-                                    saved_count += 1
-                            else:
-                                log(LogLevel.WARNING, f"Invoice date not found in email '{email_subject}'")
-                                log(LogLevel.INFO, f"Saved to temporary folder: {temp_file_path}")
-                                saved_files.append(temp_file_path)
-                                saved_count += 1
-
-                        except Exception as e:
-                            log(LogLevel.ERROR, f"Error processing PDF {attachment_name}: {str(e)}")
-                            # Clean up the temp file if processing failed
-                            if os.path.exists(temp_file_path):
-                                os.remove(temp_file_path)
-
+                        pdf_file_bytes = read_attachment_bytes(attachment, temp_file_path)
+                        pdf_jobs.append((email_subject, attachment_name, file_extension, temp_file_path, pdf_file_bytes))
                     except Exception as e:
-                        log(LogLevel.ERROR, f"Error saving attachment {attachment_name}: {str(e)}")
+                        logger.error("Error saving attachment %s: %s", attachment_name, str(e))
 
             else:
-                log(LogLevel.DEBUG, f"Skipping non-email item in selection")
+                logger.debug("Skipping non-email item in selection")
+
+        # Extract invoice data (date and invoice number) from all PDFs at once, then file them serially
+        pdf_results = extract_invoices_from_pdfs([job[4] for job in pdf_jobs])
+        created_folders = set()
+
+        for (email_subject, attachment_name, file_extension, temp_file_path, pdf_file_bytes), invoice_data in zip(pdf_jobs, pdf_results):
+            try:
+                if isinstance(invoice_data, Exception):
+                    raise invoice_data
+
+                invoice_date = invoice_data.get("Invoice Date")
+                invoice_number = invoice_data.get("Invoice")
+
+                if not invoice_number:
+                    logger.warning("Invoice number not found in email '%s'. Using original filename.", email_subject)
+                    invoice_number = os.path.splitext(attachment_name)[0]
+                else:
+                    # Remove the "-IN" suffix from invoice numbers if present
+                    if invoice_number.endswith("-IN"):
+                        invoice_number = invoice_number[:-3]  # Remove the last 3 characters ("-IN")
+
+                # Generate filename with invoice number
+                new_filename = f"{invoice_number}{file_extension}"
+
+                if invoice_date:
+                    try:
+                        # Normalize separators so only the slash formats need trying
+                        normalized_date = invoice_date.replace('-', '/')
+                        for date_format in INVOICE_DATE_FORMATS:
+                            try:
+                                due_date = datetime.strptime(normalized_date, date_format)
+                                break
+                            except ValueError:
+                                continue
+                        else:
+                            # If none of the formats worked, raise an exception
+                            raise ValueError(f"Could not parse date: {invoice_date}")
+
+                        year_folder = os.path.join(od_invoice_folder, str(due_date.year))
+                        month_folder = os.path.join(year_folder, f"{due_date.month:02d} - {due_date.year}")
+
+                        # Create the year and month folders once per run; makedirs
+                        # builds the year folder along the way
+                        if month_folder not in created_folders:
+                            os.makedirs(month_folder, exist_ok=True)
+                            created_folders.add(month_folder)
+
+                        # Write the invoice to the correct folder with new filename
+                        final_file_path = os.path.join(month_folder, new_filename)
+                        write_pdf_file(final_file_path, pdf_file_bytes)
+                        saved_files.append(final_file_path)
+                        logger.debug("Saved invoice to organized folder: %s", final_file_path)
+
+                        # Save the file to the additional folder with new filename
+                        additional_file_path = os.path.join(invoice_folder, new_filename)
+                        write_pdf_file(additional_file_path, pdf_file_bytes)
+                        logger.debug("Copied invoice to data imports: %s", additional_file_path)
+
+                        saved_count += 1
+
+                    except ValueError as e:
+                        logger.warning("Invalid date format in email '%s': %s", email_subject, e)
+                        write_pdf_file(temp_file_path, pdf_file_bytes)
+                        logger.info("Saved to temporary folder: %s", temp_file_path)
+                        saved_files.append(temp_file_path)
+                        saved_count += 1
+                else:
+                    logger.warning("Invoice date not found in email '%s'", email_subject)
+                    write_pdf_file(temp_file_path, pdf_file_bytes)
+                    logger.info("Saved to temporary folder: %s", temp_file_path)
+                    saved_files.append(temp_file_path)
+                    saved_count += 1
+
+            except Exception as e:
+                logger.error("Error processing PDF %s: %s", attachment_name, str(e))
 
         # Display summary
         display_summary(saved_files)
 
-        log(LogLevel.INFO, f"Processing complete: {saved_count}/{total_attachments} attachments saved")
+        logger.info("Processing complete: %s/%s attachments saved", saved_count, total_attachments)
         return saved_count
 
     except Exception as e:
-        log(LogLevel.ERROR, f"Error during attachment processing: {str(e)}")
+        logger.error("Error during attachment processing: %s", str(e))
         return 0
     finally:
-        log(LogLevel.DEBUG, "Uninitializing COM library")
+        logger.debug("Uninitializing COM library")
         pythoncom.CoUninitialize()  # Uninitialize COM library when done
 
 
 def display_summary(saved_files):
     """Display a summary of saved files organized by folder."""
     if not saved_files:
-        log(LogLevel.INFO, "No files were saved")
+        logger.info("No files were saved")
         return
 
     summary = {}
@@ -444,50 +489,49 @@ def display_summary(saved_files):
         summary[folder_key].append(invoice_number)
 
     for folder_key, invoice_numbers in summary.items():
-        log(LogLevel.SUCCESS, f"Invoices saved in Element Food Solutions > {folder_key}:")
+        logger.log(SUCCESS, "Invoices saved in Element Food Solutions > %s:", folder_key)
         for invoice in invoice_numbers:
-            log(LogLevel.SUCCESS, f"  - {invoice}")
+            logger.log(SUCCESS, "  - %s", invoice)
 
 
 def main():
     """Main function to execute the attachment saving process."""
-    log(LogLevel.INFO, "Starting Element Food Solutions attachment saver...")
-    pdfminer_logger = logging.getLogger('pdfminer.pdfpage')
-    pdfminer_logger.addFilter(CropBoxFilter())
+    logger.info("Starting Element Food Solutions attachment saver...")
+    install_pdfminer_log_filter()
     # Get required folder paths
-    log(LogLevel.INFO, "Locating required folders...")
+    logger.info("Locating required folders...")
     invoice_folder = get_invoice_folder_path()
     od_invoice_folder = get_od_invoice_folder_path()
 
     # Validate all required folders are found
     if not invoice_folder:
-        log(LogLevel.ERROR, "Data imports folder could not be found")
+        logger.error("Data imports folder could not be found")
         return 1
     if not od_invoice_folder:
-        log(LogLevel.ERROR, "Element Food Solutions main folder could not be found")
+        logger.error("Element Food Solutions main folder could not be found")
         return 1
 
-    # log(LogLevel.SUCCESS, f"Data imports folder: {invoice_folder}")
-    # log(LogLevel.SUCCESS, f"Main EFS folder: {od_invoice_folder}")
-    log(LogLevel.INFO, f"Data imports folder successfully located!")
-    log(LogLevel.INFO, f"Main EFS folder successfully located!")
+    # logger.log(SUCCESS, "Data imports folder: %s", invoice_folder)
+    # logger.log(SUCCESS, "Main EFS folder: %s", od_invoice_folder)
+    logger.info("Data imports folder successfully located!")
+    logger.info("Main EFS folder successfully located!")
 
     # Check if Outlook is running
-    if not is_outlook_open():
-        log(LogLevel.ERROR, "Outlook is not open. Please open Outlook and select the emails to process, then retry.")
+    if not is_outlook_open(log_debug=logger.debug):
+        logger.error("Outlook is not open. Please open Outlook and select the emails to process, then retry.")
         return 1
 
-    log(LogLevel.INFO, "Confirmed Outlook is running!")
+    logger.info("Confirmed Outlook is running!")
 
     # Save attachments from selected emails
-    log(LogLevel.DEBUG, "Starting attachment extraction from selected emails...")
+    logger.debug("Starting attachment extraction from selected emails...")
     saved_count = save_attachments_from_selected_emails(invoice_folder, od_invoice_folder)
 
     if saved_count > 0:
-        log(LogLevel.INFO, f"Operation completed successfully! Saved {saved_count} attachment(s)")
-        log(LogLevel.SUCCESS, "All selected invoices saved to OneDrive. The script is now complete.")
+        logger.info("Operation completed successfully! Saved %s attachment(s)", saved_count)
+        logger.log(SUCCESS, "All selected invoices saved to OneDrive. The script is now complete.")
     else:
-        log(LogLevel.WARNING, "No attachments were saved. Please check that you have selected emails with attachments.")
+        logger.warning("No attachments were saved. Please check that you have selected emails with attachments.")
 
     return 0
 
@@ -497,8 +541,8 @@ if __name__ == "__main__":
         exit_code = main()
         sys.exit(exit_code)
     except KeyboardInterrupt:
-        log(LogLevel.WARNING, "Script interrupted by user")
+        logger.warning("Script interrupted by user")
         sys.exit(1)
     except Exception as e:
-        log(LogLevel.ERROR, f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", str(e))
         sys.exit(1)
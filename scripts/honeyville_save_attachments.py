@@ -7,33 +7,45 @@ Saves email attachments from selected Outlook emails to Honeyville folders.
 import sys
 import os
 import pythoncom
-import win32com.client
-import psutil
-from win32com.client import Dispatch, gencache
+from win32com.client import gencache
 from datetime import datetime
 import json
-import pdfplumber
 import re
 from io import BytesIO
-import shutil
-import glob
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from _common_paths import LogLevel, log, log_enabled, find_path_with_components, is_outlook_open
 
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
 
-class LogLevel:
-    DEBUG = "[DEBUG]"
-    INFO = "[INFO]"
-    SUCCESS = "[SUCCESS]"
-    WARNING = "[WARNING]"
-    ERROR = "[ERROR]"
+# Honeyville invoice header fields, e.g. "Invoice: 123456" and "Invoice Date: 5/16/2025"
+INVOICE_PATTERN = re.compile(r"Invoice:\s*([^\n\r]+)")
+INVOICE_DATE_PATTERN = re.compile(r"Invoice Date:\s*(\d{1,2}/\d{1,2}/\d{4})")
 
+# Fallback date pattern; case-insensitive "DATE" also covers "Date" and "INVOICE Date"
+GENERAL_DATE_PATTERN = re.compile(r"DATE[:\s]*(\d{1,2}/\d{1,2}/\d{4})", re.IGNORECASE)
 
-def log(level, message):
-    """Print a log message with timestamp and level"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"{timestamp} {level} {message}")
-    sys.stdout.flush()  # Force immediate output
+# Fallback invoice number patterns, tried in order so "Invoice #" wins over "Invoice Number"
+GENERAL_INVOICE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r"INVOICE\s*#\s*[:\s]*([^\n\r]+)",
+    r"INVOICE\s*NUMBER[:\s]*([^\n\r]+)"
+])
 
+# Upper bound on worker processes used to parse PDFs in parallel
+MAX_PDF_WORKERS = 8
 
+# MAPI property holding an attachment's raw contents
+PR_ATTACH_DATA_BIN = "http://schemas.microsoft.com/mapi/proptag/0x37010102"
+
+# Outlook's OlObjectClass value for mail items (olMail)
+OL_MAIL = 43
+
+
+@functools.lru_cache(maxsize=None)
 def load_script_settings():
     """Load saved path configurations for this script"""
     settings_file = os.path.join("config", "script_settings", "honeyville_attachments_saver_settings.json")
@@ -42,7 +54,7 @@ def load_script_settings():
         try:
             with open(settings_file, 'r') as f:
                 settings = json.load(f)
-                log(LogLevel.DEBUG, f"Loaded custom path configurations from {settings_file}")
+                log(LogLevel.DEBUG, "Loaded custom path configurations from %s", settings_file)
                 return settings
         except Exception as e:
             log(LogLevel.WARNING, f"Failed to load settings file: {e}")
@@ -50,83 +62,7 @@ def load_script_settings():
     return {}
 
 
-def find_path_with_components(folder_components):
-    """Find a path containing the specified folder components."""
-    log(LogLevel.DEBUG, f"Searching for path with components: {folder_components}")
-
-    home_dir = os.path.expanduser('~')
-    # Define all possible base directories
-    possible_bases = [
-        os.path.join(home_dir, 'Kodiak Cakes'),
-        os.path.join(home_dir, 'OneDrive - Kodiak Cakes')
-    ]
-
-    # Define possible entry points from each base
-    possible_entry_points = [
-        ['Kodiak Cakes Team Site - Public'],
-        ['Kodiak Cakes Team Site - Accounting', 'Public'],
-        ['']  # Empty entry point for direct access
-    ]
-
-    for base in possible_bases:
-        log(LogLevel.DEBUG, f"Checking base directory: {base}")
-        if not os.path.exists(base):
-            log(LogLevel.DEBUG, f"Base directory does not exist: {base}")
-            continue
-
-        for entry_point in possible_entry_points:
-            current_path = base
-            for entry in entry_point:
-                if entry:  # Skip empty entry
-                    test_path = os.path.join(current_path, entry)
-                    if not os.path.exists(test_path):
-                        break
-                    current_path = test_path
-
-            result = find_components_flexible(current_path, folder_components)
-            if result:
-                log(LogLevel.DEBUG, f"Found valid path: {result}")
-                return result
-
-    log(LogLevel.DEBUG, "No valid path found")
-    return None
-
-
-def find_components_flexible(start_path, components, depth=0, max_depth=3):
-    """Recursively find folder components with flexible matching."""
-    if depth > max_depth:
-        return None
-    if not components:
-        return start_path
-
-    next_component = components[0]
-    direct_path = os.path.join(start_path, next_component)
-
-    if os.path.exists(direct_path):
-        result = find_components_flexible(direct_path, components[1:], depth, max_depth)
-        if result:
-            return result
-
-    try:
-        for item in os.listdir(start_path):
-            item_path = os.path.join(start_path, item)
-            if os.path.isdir(item_path):
-                if item.startswith('.'):
-                    continue
-                if item == next_component:
-                    result = find_components_flexible(item_path, components[1:], depth, max_depth)
-                    if result:
-                        return result
-                result = find_components_flexible(item_path, components, depth + 1, max_depth)
-                if result:
-                    return result
-    except (PermissionError, FileNotFoundError) as e:
-        log(LogLevel.DEBUG, f"Access denied or file not found: {e}")
-        pass
-
-    return None
-
-
+@functools.lru_cache(maxsize=None)
 def get_folder_path(components, settings_key=None):
     """Get the full path for the specified folder components, checking settings first."""
     # Check if we have a configured path for this key
@@ -150,91 +86,150 @@ def get_folder_path(components, settings_key=None):
 
 def get_od_invoice_folder_path():
     """Get path to the Honeyville shipments folder."""
-    folder_components = ['Waffle-Dry', 'Honeyville', 'Shipments to RJW']
+    folder_components = ('Waffle-Dry', 'Honeyville', 'Shipments to RJW')
     return get_folder_path(folder_components, 'shipments_folder')
 
 
 def get_invoice_folder_path():
     """Get path to the Honeyville data imports folder."""
-    folder_components = ['Waffle-Dry', 'Honeyville', 'Data Imports']
+    folder_components = ('Waffle-Dry', 'Honeyville', 'Data Imports')
     return get_folder_path(folder_components, 'data_imports_folder')
 
 
-def is_outlook_open():
-    """Check if Outlook is currently running."""
-    log(LogLevel.DEBUG, "Checking if Outlook is running...")
-    for process in psutil.process_iter(['name']):
-        if process.info['name'] == "OUTLOOK.EXE":
-            log(LogLevel.DEBUG, "Outlook process found")
-            return True
-    log(LogLevel.DEBUG, "Outlook process not found")
-    return False
+def read_attachment_bytes(attachment, temp_file_path):
+    """Read an Outlook attachment's contents straight from MAPI.
+
+    Falls back to a SaveAsFile round-trip through temp_file_path when the
+    binary property is not available (e.g. very large attachments).
+    """
+    try:
+        return bytes(attachment.PropertyAccessor.GetProperty(PR_ATTACH_DATA_BIN))
+    except Exception as e:
+        log(LogLevel.DEBUG, "Could not read attachment data from MAPI, using a temporary file: %s", e)
+
+    attachment.SaveAsFile(temp_file_path)
+    try:
+        with open(temp_file_path, 'rb') as file:
+            return file.read()
+    finally:
+        os.remove(temp_file_path)
+
+
+def write_pdf_file(file_path, pdf_file_bytes):
+    """Write PDF bytes to disk in a single buffered write."""
+    with open(file_path, 'wb', buffering=1 << 20) as file:
+        file.write(pdf_file_bytes)
+
+
+def iter_pdf_page_texts(pdf_file_bytes):
+    """Yield the text of each PDF page in order.
+
+    Uses PyMuPDF's native parser when it is installed; pdfplumber is the
+    fallback when PyMuPDF is missing or can't open the file.
+    """
+    if PYMUPDF_AVAILABLE:
+        try:
+            doc = fitz.open(stream=pdf_file_bytes, filetype="pdf")
+        except Exception as e:
+            log(LogLevel.DEBUG, "PyMuPDF could not open PDF, using pdfplumber: %s", e)
+        else:
+            with doc:
+                for page in doc:
+                    yield page.get_text("text")
+            return
+
+    # pdfplumber drags in pdfminer and PIL, so only import it when it's needed
+    import pdfplumber
+
+    with pdfplumber.open(BytesIO(pdf_file_bytes)) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ""
 
 
 def extract_text_from_pdf(pdf_file_bytes):
-    """Extract text from PDF bytes using pdfplumber."""
+    """Extract text from PDF bytes, stopping once the invoice header fields are found."""
     text = ''
     try:
-        with pdfplumber.open(BytesIO(pdf_file_bytes)) as pdf:
-            for page in pdf.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text += extracted
+        for extracted in iter_pdf_page_texts(pdf_file_bytes):
+            text += extracted
+            # The header is normally on page 1, so later pages are rarely needed
+            if INVOICE_PATTERN.search(text) and INVOICE_DATE_PATTERN.search(text):
+                break
         return text
     except Exception as e:
         raise Exception(f"Failed to extract text from PDF: {str(e)}")
 
 
+def extract_invoice_from_pdf(pdf_file_bytes):
+    """Extract invoice data (date and invoice number) from PDF bytes."""
+    return extract_invoice_data(extract_text_from_pdf(pdf_file_bytes))
+
+
+def extract_invoices_from_pdfs(pdf_blobs):
+    """Extract invoice data from several PDFs, returning the data or the raised exception for each.
+
+    PDF parsing is CPU-bound and holds the GIL, so multiple PDFs are parsed in
+    worker processes; a single PDF is parsed inline to avoid the process start-up cost.
+    """
+    if len(pdf_blobs) < 2:
+        results = []
+        for pdf_file_bytes in pdf_blobs:
+            try:
+                results.append(extract_invoice_from_pdf(pdf_file_bytes))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    max_workers = min(MAX_PDF_WORKERS, os.cpu_count() or 1, len(pdf_blobs))
+    log(LogLevel.DEBUG, "Extracting invoice data from %s PDFs with %s worker processes", len(pdf_blobs), max_workers)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(extract_invoice_from_pdf, pdf_file_bytes) for pdf_file_bytes in pdf_blobs]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+    return results
+
+
 def extract_invoice_data(text):
     """Extract invoice number and date from PDF text."""
     extracted_data = {}
 
     # Debug: Log first 500 characters to see what we're working with
-    debug_text = text[:500].replace('\n', '\\n')
-    log(LogLevel.DEBUG, f"First 500 chars of PDF text: {debug_text}")
+    if log_enabled(LogLevel.DEBUG):
+        debug_text = text[:500].replace('\n', '\\n')
+        log(LogLevel.DEBUG, "First 500 chars of PDF text: %s", debug_text)
 
     # Try to find invoice date using Honeyville-specific patterns
-    invoice_date_match = re.search(r"Invoice Date:\s*(\d{1,2}/\d{1,2}/\d{4})", text)
+    invoice_date_match = INVOICE_DATE_PATTERN.search(text)
     if invoice_date_match:
         extracted_data["Invoice Date"] = invoice_date_match.group(1).strip()
-        log(LogLevel.DEBUG, f"Found invoice date: {extracted_data['Invoice Date']}")
+        log(LogLevel.DEBUG, "Found invoice date: %s", extracted_data['Invoice Date'])
 
     # Try to find invoice number using Honeyville-specific patterns
-    invoice_match = re.search(r"Invoice:\s*([^\n\r]+)", text)
+    invoice_match = INVOICE_PATTERN.search(text)
     if invoice_match:
         extracted_data["Invoice"] = invoice_match.group(1).strip()
-        log(LogLevel.DEBUG, f"Found invoice number: {extracted_data['Invoice']}")
+        log(LogLevel.DEBUG, "Found invoice number: %s", extracted_data['Invoice'])
 
     # If no specific patterns found, try more general patterns
     if "Invoice Date" not in extracted_data:
-        # Try more general date patterns
-        date_patterns = [
-            r"DATE[:\s]*(\d{1,2}/\d{1,2}/\d{4})",
-            r"Date[:\s]*(\d{1,2}/\d{1,2}/\d{4})",
-            r"INVOICE\s*Date[:\s]*(\d{1,2}/\d{1,2}/\d{4})"
-        ]
-
-        for pattern in date_patterns:
-            date_match = re.search(pattern, text, re.IGNORECASE)
-            if date_match:
-                extracted_data["Invoice Date"] = date_match.group(1).strip()
-                log(LogLevel.DEBUG, f"Found date using general pattern: {extracted_data['Invoice Date']}")
-                break
+        # Try the more general date pattern
+        date_match = GENERAL_DATE_PATTERN.search(text)
+        if date_match:
+            extracted_data["Invoice Date"] = date_match.group(1).strip()
+            log(LogLevel.DEBUG, "Found date using general pattern: %s", extracted_data['Invoice Date'])
 
     if "Invoice" not in extracted_data:
         # Try more general invoice patterns
-        invoice_patterns = [
-            r"INVOICE\s*#\s*[:\s]*([^\n\r]+)",
-            r"INVOICE\s*NUMBER[:\s]*([^\n\r]+)",
-            r"Invoice\s*#[:\s]*([^\n\r]+)",
-            r"Invoice\s*Number[:\s]*([^\n\r]+)"
-        ]
-
-        for pattern in invoice_patterns:
-            invoice_match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in GENERAL_INVOICE_PATTERNS:
+            invoice_match = pattern.search(text)
             if invoice_match:
                 extracted_data["Invoice"] = invoice_match.group(1).strip()
-                log(LogLevel.DEBUG, f"Found invoice using general pattern: {extracted_data['Invoice']}")
+                log(LogLevel.DEBUG, "Found invoice using general pattern: %s", extracted_data['Invoice'])
                 break
 
     return extracted_data
@@ -247,8 +242,8 @@ def save_attachments_from_selected_emails(invoice_folder, od_invoice_folder):
 
     try:
         log(LogLevel.INFO, "Connecting to Outlook application...")
-        outlook = Dispatch("Outlook.Application")
-        gencache.EnsureDispatch(outlook.Application)
+        # Early-bound dispatch so member lookups go through the generated type library
+        outlook = gencache.EnsureDispatch("Outlook.Application")
         namespace = outlook.GetNamespace("MAPI")
         explorer = outlook.ActiveExplorer()
         selection = explorer.Selection
@@ -257,119 +252,126 @@ def save_attachments_from_selected_emails(invoice_folder, od_invoice_folder):
             log(LogLevel.WARNING, "No emails selected in Outlook")
             return 0
 
-        log(LogLevel.INFO, f"Found {len(selection)} selected email(s)")
-
-        # Clean up existing PDFs in data imports folder
-        log(LogLevel.INFO, "Cleaning up existing PDF files in data imports folder...")
-        pdf_files = glob.glob(os.path.join(invoice_folder, '*.pdf'))
-        for pdf_file in pdf_files:
-            try:
-                os.remove(pdf_file)
-                log(LogLevel.DEBUG, f"Deleted existing PDF: {pdf_file}")
-            except Exception as e:
-                log(LogLevel.WARNING, f"Error deleting {pdf_file}: {e}")
+        selection_count = selection.Count
+        log(LogLevel.INFO, f"Found {selection_count} selected email(s)")
 
         saved_count = 0
         total_attachments = 0
         saved_files = []
 
+        # Save attachments first; COM objects must stay on this thread
+        pdf_jobs = []
         for i, item in enumerate(selection, 1):
-            log(LogLevel.DEBUG, f"Processing email {i}/{len(selection)}")
+            log(LogLevel.DEBUG, "Processing email %s/%s", i, selection_count)
 
-            if item.Class == win32com.client.constants.olMail:
+            if item.Class == OL_MAIL:
                 email_subject = getattr(item, 'Subject', 'No Subject')
                 log(LogLevel.INFO, f"Processing email: {email_subject[:50]}...")
 
-                if item.Attachments.Count == 0:
-                    log(LogLevel.DEBUG, f"No attachments found in email: {email_subject[:30]}...")
+                attachments = item.Attachments
+                attachment_count = attachments.Count
+                if attachment_count == 0:
+                    log(LogLevel.DEBUG, "No attachments found in email: %s...", email_subject[:30])
                     continue
 
-                for attachment in item.Attachments:
+                for index in range(1, attachment_count + 1):
+                    attachment = attachments.Item(index)
                     total_attachments += 1
                     attachment_name = attachment.FileName
+                    name_stem, file_extension = os.path.splitext(attachment_name)
 
-                    # Save the attachment to a temporary file
+                    # Fallback location when the invoice can't be filed by date
                     temp_file_path = os.path.join(od_invoice_folder, attachment_name)
 
                     try:
-                        attachment.SaveAsFile(temp_file_path)
-                        log(LogLevel.DEBUG, f"Saved temporary file: {temp_file_path}")
-
-                        # Read the temporary file as bytes for PDF processing
-                        with open(temp_file_path, 'rb') as file:
-                            pdf_file_bytes = file.read()
+                        pdf_file_bytes = read_attachment_bytes(attachment, temp_file_path)
+                        log(LogLevel.DEBUG, "Read attachment: %s", attachment_name)
 
-                        # Try to extract text and process the PDF
-                        try:
-                            pdf_text = extract_text_from_pdf(pdf_file_bytes)
-
-                            # Extract invoice data (date and invoice number)
-                            invoice_data = extract_invoice_data(pdf_text)
-
-                            invoice_date = invoice_data.get("Invoice Date")
-                            invoice_number = invoice_data.get("Invoice")
-
-                            if not invoice_number:
-                                log(LogLevel.WARNING, f"Invoice number not found in email '{email_subject}'. Using original filename.")
-                                invoice_number = os.path.splitext(attachment_name)[0]
-                            else:
-                                # Remove the "-IN" suffix from invoice numbers if present
-                                if invoice_number.endswith("-IN"):
-                                    invoice_number = invoice_number[:-3]  # Remove the last 3 characters ("-IN")
-
-                            # Generate filename with invoice number
-                            file_extension = os.path.splitext(attachment_name)[1]
-                            new_filename = f"{invoice_number}{file_extension}"
-
-                            if invoice_date:
-                                try:
-                                    # Try to parse the date
-                                    due_date = datetime.strptime(invoice_date, "%m/%d/%Y")
-
-                                    year_folder = os.path.join(od_invoice_folder, str(due_date.year))
-                                    month_folder = os.path.join(year_folder, f"{due_date.strftime('%m')} - {due_date.year}")
-
-                                    # Create year and month folders if they don't exist
-                                    if not os.path.exists(year_folder):
-                                        os.makedirs(year_folder)
-                                    if not os.path.exists(month_folder):
-                                        os.makedirs(month_folder)
-
-                                    # Move the temporary file to the correct folder with new filename
-                                    final_file_path = os.path.join(month_folder, new_filename)
-                                    shutil.move(temp_file_path, final_file_path)
-                                    saved_files.append(final_file_path)
-                                    log(LogLevel.SUCCESS, f"Saved invoice to organized folder: {final_file_path}")
-
-                                    # Save the file to the additional folder with new filename
-                                    additional_file_path = os.path.join(invoice_folder, new_filename)
-                                    shutil.copy(final_file_path, additional_file_path)
-                                    log(LogLevel.SUCCESS, f"Copied invoice to data imports: {additional_file_path}")
-
-                                    saved_count += 1
-
-                                except ValueError as e:
-                                    log(LogLevel.WARNING, f"Invalid date format in email '{email_subject}': {e}")
-                                    log(LogLevel.INFO, f"Saved to temporary folder: {temp_file_path}")
-                                    saved_files.append(temp_file_path)
-                                    saved_count += 1
-                            else:
-                                log(LogLevel.WARNING, f"Invoice date not found in email '{email_subject}'")
-                                log(LogLevel.INFO, f"Saved to temporary folder: {temp_file_path}")
-                                saved_files.append(temp_file_path)
-                                saved_count += 1
-
-                        except Exception as e:
-                            log(LogLevel.ERROR, f"Error processing PDF {attachment_name}: {str(e)}")
-                            # Clean up the temp file if processing failed
-                            if os.path.exists(temp_file_path):
-                                os.remove(temp_file_path)
+                        pdf_jobs.append((email_subject, attachment_name, name_stem, file_extension, temp_file_path, pdf_file_bytes))
 
                     except Exception as e:
                         log(LogLevel.ERROR, f"Error saving attachment {attachment_name}: {str(e)}")
 
             else:
-                log(LogLevel.DEBUG, f"Skipping non-email item in selection")
+                log(LogLevel.DEBUG, "Skipping non-email item in selection")
+
+        # Clean up existing PDFs in data imports folder, unless there is nothing to replace them with
+        if pdf_jobs:
+            log(LogLevel.INFO, "Cleaning up existing PDF files in data imports folder...")
+            with os.scandir(invoice_folder) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.lower().endswith('.pdf'):
+                        try:
+                            os.remove(entry.path)
+                            log(LogLevel.DEBUG, "Deleted existing PDF: %s", entry.path)
+                        except OSError as e:
+                            log(LogLevel.WARNING, f"Error deleting {entry.path}: {e}")
+
+        # Extract invoice data (date and invoice number) from all PDFs at once, then file them serially
+        pdf_results = extract_invoices_from_pdfs([job[5] for job in pdf_jobs])
+        created_folders = set()
+
+        for (email_subject, attachment_name, name_stem, file_extension, temp_file_path, pdf_file_bytes), invoice_data in zip(pdf_jobs, pdf_results):
+            try:
+                if isinstance(invoice_data, Exception):
+                    raise invoice_data
+
+                invoice_date = invoice_data.get("Invoice Date")
+                invoice_number = invoice_data.get("Invoice")
+
+                if not invoice_number:
+                    log(LogLevel.WARNING, f"Invoice number not found in email '{email_subject}'. Using original filename.")
+                    invoice_number = name_stem
+                else:
+                    # Remove the "-IN" suffix from invoice numbers if present
+                    if invoice_number.endswith("-IN"):
+                        invoice_number = invoice_number[:-3]  # Remove the last 3 characters ("-IN")
+
+                # Generate filename with invoice number
+                new_filename = f"{invoice_number}{file_extension}"
+
+                if invoice_date:
+                    try:
+                        # Try to parse the date
+                        due_date = datetime.strptime(invoice_date, "%m/%d/%Y")
+
+                        year_folder = os.path.join(od_invoice_folder, str(due_date.year))
+                        month_folder = os.path.join(year_folder, f"{due_date.month:02d} - {due_date.year}")
+
+                        # Create the year and month folders once per run; makedirs
+                        # builds the year folder along the way
+                        if month_folder not in created_folders:
+                            os.makedirs(month_folder, exist_ok=True)
+                            created_folders.add(month_folder)
+
+                        # Write the invoice to the correct folder with new filename
+                        final_file_path = os.path.join(month_folder, new_filename)
+                        write_pdf_file(final_file_path, pdf_file_bytes)
+                        saved_files.append(final_file_path)
+                        log(LogLevel.SUCCESS, f"Saved invoice to organized folder: {final_file_path}")
+
+                        # Save the file to the additional folder with new filename
+                        additional_file_path = os.path.join(invoice_folder, new_filename)
+                        write_pdf_file(additional_file_path, pdf_file_bytes)
+                        log(LogLevel.SUCCESS, f"Copied invoice to data imports: {additional_file_path}")
+
+                        saved_count += 1
+
+                    except ValueError as e:
+                        log(LogLevel.WARNING, f"Invalid date format in email '{email_subject}': {e}")
+                        write_pdf_file(temp_file_path, pdf_file_bytes)
+                        log(LogLevel.INFO, f"Saved to temporary folder: {temp_file_path}")
+                        saved_files.append(temp_file_path)
+                        saved_count += 1
+                else:
+                    log(LogLevel.WARNING, f"Invoice date not found in email '{email_subject}'")
+                    write_pdf_file(temp_file_path, pdf_file_bytes)
+                    log(LogLevel.INFO, f"Saved to temporary folder: {temp_file_path}")
+                    saved_files.append(temp_file_path)
+                    saved_count += 1
+
+            except Exception as e:
+                log(LogLevel.ERROR, f"Error processing PDF {attachment_name}: {str(e)}")
 
         # Display summary
         display_summary(saved_files)
@@ -7,26 +7,12 @@ Saves email attachments from selected Outlook emails to the Schneider import bil
 import sys
 import os
 import pythoncom
-import win32com.client
-import psutil
-from win32com.client import Dispatch, gencache
-from datetime import datetime
+from win32com.client import gencache
 import json
+from _common_paths import LogLevel, log, find_path_with_components, is_outlook_open
 
-
-class LogLevel:
-    DEBUG = "[DEBUG]"
-    INFO = "[INFO]"
-    SUCCESS = "[SUCCESS]"
-    WARNING = "[WARNING]"
-    ERROR = "[ERROR]"
-
-
-def log(level, message):
-    """Print a log message with timestamp and level"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"{timestamp} {level} {message}")
-    sys.stdout.flush()  # Force immediate output
+# Outlook's OlObjectClass value for mail items (olMail)
+OL_MAIL = 43
 
 
 def load_script_settings():
@@ -37,7 +23,7 @@ def load_script_settings():
         try:
             with open(settings_file, 'r') as f:
                 settings = json.load(f)
-                log(LogLevel.DEBUG, f"Loaded custom path configurations from {settings_file}")
+                log(LogLevel.DEBUG, "Loaded custom path configurations from %s", settings_file)
                 return settings
         except Exception as e:
             log(LogLevel.WARNING, f"Failed to load settings file: {e}")
@@ -45,83 +31,6 @@ def load_script_settings():
     return {}
 
 
-def find_path_with_components(folder_components):
-    """Find a path containing the specified folder components."""
-    log(LogLevel.DEBUG, f"Searching for path with components: {folder_components}")
-
-    home_dir = os.path.expanduser('~')
-    # Define all possible base directories
-    possible_bases = [
-        os.path.join(home_dir, 'Kodiak Cakes'),
-        os.path.join(home_dir, 'OneDrive - Kodiak Cakes')
-    ]
-
-    # Define possible entry points from each base
-    possible_entry_points = [
-        ['Kodiak Cakes Team Site - Public'],
-        ['Kodiak Cakes Team Site - Accounting', 'Public'],
-        ['']  # Empty entry point for direct access
-    ]
-
-    for base in possible_bases:
-        log(LogLevel.DEBUG, f"Checking base directory: {base}")
-        if not os.path.exists(base):
-            log(LogLevel.DEBUG, f"Base directory does not exist: {base}")
-            continue
-
-        for entry_point in possible_entry_points:
-            current_path = base
-            for entry in entry_point:
-                if entry:  # Skip empty entry
-                    test_path = os.path.join(current_path, entry)
-                    if not os.path.exists(test_path):
-                        break
-                    current_path = test_path
-
-            result = find_components_flexible(current_path, folder_components)
-            if result:
-                log(LogLevel.DEBUG, f"Found valid path: {result}")
-                return result
-
-    log(LogLevel.DEBUG, "No valid path found")
-    return None
-
-
-def find_components_flexible(start_path, components, depth=0, max_depth=3):
-    """Recursively find folder components with flexible matching."""
-    if depth > max_depth:
-        return None
-    if not components:
-        return start_path
-
-    next_component = components[0]
-    direct_path = os.path.join(start_path, next_component)
-
-    if os.path.exists(direct_path):
-        result = find_components_flexible(direct_path, components[1:], depth, max_depth)
-        if result:
-            return result
-
-    try:
-        for item in os.listdir(start_path):
-            item_path = os.path.join(start_path, item)
-            if os.path.isdir(item_path):
-                if item.startswith('.'):
-                    continue
-                if item == next_component:
-                    result = find_components_flexible(item_path, components[1:], depth, max_depth)
-                    if result:
-                        return result
-                result = find_components_flexible(item_path, components, depth + 1, max_depth)
-                if result:
-                    return result
-    except (PermissionError, FileNotFoundError) as e:
-        log(LogLevel.DEBUG, f"Access denied or file not found: {e}")
-        pass
-
-    return None
-
-
 def get_folder_path(components, settings_key=None):
     """Get the full path for the specified folder components, checking settings first."""
     # Check if we have a configured path for this key
@@ -145,45 +54,34 @@ def get_folder_path(components, settings_key=None):
 
 def get_po_workbook():
     """Get path to the POs by Division workbook."""
-    folder_components = ['Vendors', 'Schneider National Inc', 'Imports', 'POs by Division.xlsx']
+    folder_components = ('Vendors', 'Schneider National Inc', 'Imports', 'POs by Division.xlsx')
     return get_folder_path(folder_components)
 
 
 def get_import_bills_folder_path():
     """Get path to the import bills folder."""
-    folder_components = ['Vendors', 'Schneider National Inc', 'Imports', 'Bills']
+    folder_components = ('Vendors', 'Schneider National Inc', 'Imports', 'Bills')
     return get_folder_path(folder_components, 'import_bills_folder')
 
 
 def get_schneider_report_folder():
     """Get path to the Schneider report folder."""
-    folder_components = ['Vendors', 'Schneider National Inc', 'Imports', 'Schneider Report']
+    folder_components = ('Vendors', 'Schneider National Inc', 'Imports', 'Schneider Report')
     return get_folder_path(folder_components, 'schneider_report_folder')
 
 
 def get_upload_template():
     """Get path to the upload template."""
-    folder_components = ['Vendors', 'Schneider National Inc', 'Imports', 'Schneider Upload Template.xlsx']
+    folder_components = ('Vendors', 'Schneider National Inc', 'Imports', 'Schneider Upload Template.xlsx')
     return get_folder_path(folder_components)
 
 
 def get_csv_upload_base_folder():
     """Get path to the CSV uploads folder."""
-    folder_components = ['Vendors', 'Schneider National Inc', 'Imports', 'CSV Uploads']
+    folder_components = ('Vendors', 'Schneider National Inc', 'Imports', 'CSV Uploads')
     return get_folder_path(folder_components, 'csv_uploads_folder')
 
 
-def is_outlook_open():
-    """Check if Outlook is currently running."""
-    log(LogLevel.DEBUG, "Checking if Outlook is running...")
-    for process in psutil.process_iter(['name']):
-        if process.info['name'] == "OUTLOOK.EXE":
-            log(LogLevel.DEBUG, "Outlook process found")
-            return True
-    log(LogLevel.DEBUG, "Outlook process not found")
-    return False
-
-
 def save_attachments_from_selected_emails(folder_path):
     """Save attachments from selected emails in Outlook to the specified folder."""
     log(LogLevel.DEBUG, "Initializing COM library for Outlook integration...")
@@ -191,8 +89,8 @@ def save_attachments_from_selected_emails(folder_path):
 
     try:
         log(LogLevel.INFO, "Connecting to Outlook application...")
-        outlook = Dispatch("Outlook.Application")
-        gencache.EnsureDispatch(outlook.Application)
+        # Early-bound dispatch so member lookups go through the generated type library
+        outlook = gencache.EnsureDispatch("Outlook.Application")
         namespace = outlook.GetNamespace("MAPI")
         explorer = outlook.ActiveExplorer()
         selection = explorer.Selection
@@ -201,7 +99,8 @@ def save_attachments_from_selected_emails(folder_path):
             log(LogLevel.WARNING, "No emails selected in Outlook")
             return 0
 
-        log(LogLevel.INFO, f"Found {len(selection)} selected email(s)")
+        selection_count = selection.Count
+        log(LogLevel.INFO, f"Found {selection_count} selected email(s)")
 
         if not os.path.exists(folder_path):
             log(LogLevel.INFO, f"Creating directory: {folder_path}")
@@ -211,17 +110,20 @@ def save_attachments_from_selected_emails(folder_path):
         total_attachments = 0
 
         for i, item in enumerate(selection, 1):
-            log(LogLevel.DEBUG, f"Processing email {i}/{len(selection)}")
+            log(LogLevel.DEBUG, "Processing email %s/%s", i, selection_count)
 
-            if item.Class == win32com.client.constants.olMail:
+            if item.Class == OL_MAIL:
                 email_subject = getattr(item, 'Subject', 'No Subject')
                 log(LogLevel.INFO, f"Processing email: {email_subject[:50]}...")
 
-                if item.Attachments.Count == 0:
-                    log(LogLevel.DEBUG, f"No attachments found in email: {email_subject[:30]}...")
+                attachments = item.Attachments
+                attachment_count = attachments.Count
+                if attachment_count == 0:
+                    log(LogLevel.DEBUG, "No attachments found in email: %s...", email_subject[:30])
                     continue
 
-                for attachment in item.Attachments:
+                for index in range(1, attachment_count + 1):
+                    attachment = attachments.Item(index)
                     total_attachments += 1
                     attachment_name = attachment.FileName
                     save_path = os.path.join(folder_path, attachment_name)
@@ -239,7 +141,7 @@ def save_attachments_from_selected_emails(folder_path):
                     except Exception as e:
                         log(LogLevel.ERROR, f"Failed to save attachment {attachment_name}: {str(e)}")
             else:
-                log(LogLevel.DEBUG, f"Skipping non-email item in selection")
+                log(LogLevel.DEBUG, "Skipping non-email item in selection")
 
         log(LogLevel.INFO, f"Processing complete: {saved_count}/{total_attachments} attachments saved")
         return saved_count
@@ -274,8 +176,8 @@ def main():
         return 1
 
     log(LogLevel.SUCCESS, f"Import bills folder: {import_bills_folder}")
-    log(LogLevel.DEBUG, f"Schneider report folder: {schneider_report_folder}")
-    log(LogLevel.DEBUG, f"CSV uploads folder: {csv_uploads_base_folder}")
+    log(LogLevel.DEBUG, "Schneider report folder: %s", schneider_report_folder)
+    log(LogLevel.DEBUG, "CSV uploads folder: %s", csv_uploads_base_folder)
 
     # Check if Outlook is running
     if not is_outlook_open():
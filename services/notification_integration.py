@@ -3,11 +3,51 @@ System notification integration service - connects notification manager to appli
 Save this as: services/notification_integration.py
 """
 
+import functools
 import logging
+import re
+import threading
 from typing import Dict, Any, Optional
 from utils.event_bus import get_event_bus, Events
 from utils.state_manager import get_state_manager
-from services.notification_manager import get_notification_manager
+from services.notification_manager import get_notification_manager, TEST_NOTIFICATION_INTERVAL
+
+# Common script file extensions, stripped from names shown in notifications
+SCRIPT_EXTENSION_PATTERN = re.compile(r'\.(?:py|pyw|bat|sh)$', re.IGNORECASE)
+
+# (title, message template) for each notification the integration shows
+_TEMPLATES = {
+    'start': ("Script Started", "{name} has begun execution"),
+    'success': ("Script Completed Successfully", "{name} finished without errors"),
+    'error_code': ("Script Failed", "{name} encountered an error (exit code: {code})"),
+    'error_message': ("Script Error", "{name} failed: {error}"),
+    'error_exit': ("Script Error", "{name} failed with exit code {code}"),
+    'stopped': ("Script Stopped", "{name} was stopped by user"),
+    'terminated': ("Script Terminated", "{name} was terminated unexpectedly"),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _format_script_name(script_name: str) -> str:
+    """Strip the extension, replace underscores with spaces and title case"""
+    return SCRIPT_EXTENSION_PATTERN.sub('', script_name, count=1).replace('_', ' ').title()
+
+
+def _safe(action: str):
+    """Decorate an event handler so errors are logged instead of raised
+
+    Args:
+        action: What the handler does, used in the error message
+    """
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(self, data):
+            try:
+                return handler(self, data)
+            except Exception as e:
+                self.logger.error(f"Error {action}: {e}")
+        return wrapper
+    return decorator
 
 
 class NotificationIntegration:
@@ -22,23 +62,68 @@ class NotificationIntegration:
         self.state_manager = get_state_manager()
         self.notification_manager = get_notification_manager()
 
+        # Whether the script event handlers are currently on the event bus
+        self._script_events_subscribed = False
+
+        # State keys this integration reacts to -> setter for the new value
+        self._state_handlers = {
+            'notifications_enabled': self.set_notifications_enabled,
+            'notification_duration': self.notification_manager.set_duration,
+            'silent_notifications': self.notification_manager.set_silent,
+        }
+
         # Setup event subscriptions
         self.setup_event_subscriptions()
 
         # Load initial settings
         self.load_notification_settings()
 
+    def _script_event_subscriptions(self):
+        """(event_name, handler) pairs for script execution events"""
+        return (
+            (Events.SCRIPT_STARTED, self.on_script_started),
+            (Events.SCRIPT_COMPLETED, self.on_script_completed),
+            (Events.SCRIPT_ERROR, self.on_script_error),
+            (Events.SCRIPT_STOPPED, self.on_script_stopped),
+        )
+
+    def _settings_event_subscriptions(self):
+        """(event_name, handler) pairs for settings change events"""
+        return (
+            ('settings.saved', self.on_settings_changed),
+            ('state.changed', self.on_state_changed),
+        )
+
     def setup_event_subscriptions(self):
         """Subscribe to relevant application events"""
-        # Script execution events
-        self.event_bus.subscribe(Events.SCRIPT_STARTED, self.on_script_started)
-        self.event_bus.subscribe(Events.SCRIPT_COMPLETED, self.on_script_completed)
-        self.event_bus.subscribe(Events.SCRIPT_ERROR, self.on_script_error)
-        self.event_bus.subscribe(Events.SCRIPT_STOPPED, self.on_script_stopped)
-
-        # Settings change events
-        self.event_bus.subscribe('settings.saved', self.on_settings_changed)
-        self.event_bus.subscribe('state.changed', self.on_state_changed)
+        self.event_bus.subscribe_many(self._settings_event_subscriptions())
+        self.subscribe_script_events()
+
+    def subscribe_script_events(self):
+        """Put the script event handlers on the event bus (no-op if already there)"""
+        if self._script_events_subscribed:
+            return
+        self.event_bus.subscribe_many(self._script_event_subscriptions())
+        self._script_events_subscribed = True
+
+    def unsubscribe_script_events(self):
+        """Take the script event handlers off the event bus (no-op if not there)"""
+        if not self._script_events_subscribed:
+            return
+        self.event_bus.unsubscribe_many(self._script_event_subscriptions())
+        self._script_events_subscribed = False
+
+    def set_notifications_enabled(self, enabled: bool):
+        """Enable or disable notifications
+
+        While disabled, the script event handlers are unsubscribed so script
+        events are not dispatched to this integration at all.
+        """
+        self.notification_manager.set_enabled(enabled)
+        if enabled:
+            self.subscribe_script_events()
+        else:
+            self.unsubscribe_script_events()
 
     def load_notification_settings(self):
         """Load notification settings from state manager"""
@@ -49,7 +134,7 @@ class NotificationIntegration:
             silent_notifications = self.state_manager.get('silent_notifications', True)  # NEW
 
             # Apply to notification manager
-            self.notification_manager.set_enabled(notifications_enabled)
+            self.set_notifications_enabled(notifications_enabled)
             self.notification_manager.set_duration(notification_duration)
             self.notification_manager.set_silent(silent_notifications)  # NEW
 
@@ -62,8 +147,9 @@ class NotificationIntegration:
 
     def should_show_notification(self, notification_type: str) -> bool:
         """Check if a specific notification type should be shown"""
-        # Check if notifications are globally enabled
-        if not self.state_manager.get('notifications_enabled', True):
+        # Check if notifications are globally enabled; every path that changes
+        # the setting also calls notification_manager.set_enabled
+        if not self.notification_manager.notifications_enabled:
             return False
 
         # Check if this specific notification type is enabled
@@ -72,188 +158,160 @@ class NotificationIntegration:
 
     def format_script_name(self, script_name: str) -> str:
         """Format script name for display in notifications"""
-        # Remove file extensions and clean up the name
+        # The same few scripts are announced over and over, so names are cached
         if script_name:
-            # Remove common extensions
-            for ext in ['.py', '.pyw', '.bat', '.sh']:
-                if script_name.lower().endswith(ext):
-                    script_name = script_name[:-len(ext)]
-                    break
-
-            # Replace underscores with spaces and title case
-            script_name = script_name.replace('_', ' ').title()
+            script_name = _format_script_name(script_name)
 
         return script_name or "Script"
 
+    @_safe("showing script start notification")
     def on_script_started(self, data: Dict[str, Any]):
         """Handle script started event"""
-        try:
-            if self.should_show_notification('script_start'):
-                script_name = self.format_script_name(data.get('script_name', 'Script'))
-
-                title = "Script Started"
-                message = f"{script_name} has begun execution"
+        if self.should_show_notification('script_start'):
+            script_name = self.format_script_name(data.get('script_name', 'Script'))
 
-                self.notification_manager.show_notification(title, message, 'start')
-                self.logger.debug(f"Showed script start notification for: {script_name}")
+            title, template = _TEMPLATES['start']
+            message = template.format(name=script_name)
 
-        except Exception as e:
-            self.logger.error(f"Error showing script start notification: {e}")
+            self.notification_manager.show_notification(title, message, 'start')
+            self.logger.debug(f"Showed script start notification for: {script_name}")
 
+    @_safe("showing script completion notification")
     def on_script_completed(self, data: Dict[str, Any]):
         """Handle script completed event"""
-        try:
-            # Determine if it was successful or not
-            status = data.get('status', 'unknown')
-            exit_code = data.get('exit_code', 0)
-            script_name = self.format_script_name(data.get('script_name', 'Script'))
-
-            if status == 'success' or exit_code == 0:
-                if self.should_show_notification('script_success'):
-                    title = "Script Completed Successfully"
-                    message = f"{script_name} finished without errors"
-
-                    self.notification_manager.show_notification(title, message, 'success')
-                    self.logger.debug(f"Showed script success notification for: {script_name}")
-            else:
-                if self.should_show_notification('script_error'):
-                    title = "Script Failed"
-                    message = f"{script_name} encountered an error (exit code: {exit_code})"
-
-                    self.notification_manager.show_notification(title, message, 'error')
-                    self.logger.debug(f"Showed script error notification for: {script_name}")
-
-        except Exception as e:
-            self.logger.error(f"Error showing script completion notification: {e}")
-
-    def on_script_error(self, data: Dict[str, Any]):
-        """Handle script error event"""
-        try:
+        # Determine if it was successful or not
+        status = data.get('status', 'unknown')
+        exit_code = data.get('exit_code', 0)
+        script_name = self.format_script_name(data.get('script_name', 'Script'))
+
+        if status == 'success' or exit_code == 0:
+            if self.should_show_notification('script_success'):
+                title, template = _TEMPLATES['success']
+                message = template.format(name=script_name)
+
+                self.notification_manager.show_notification(title, message, 'success')
+                self.logger.debug(f"Showed script success notification for: {script_name}")
+        else:
             if self.should_show_notification('script_error'):
-                script_name = self.format_script_name(data.get('script_name', 'Script'))
-                exit_code = data.get('exit_code', 'Unknown')
-                error_msg = data.get('error', '')
-
-                title = "Script Error"
-
-                # Create informative message
-                if error_msg:
-                    # Truncate long error messages for notification
-                    if len(error_msg) > 100:
-                        error_msg = error_msg[:97] + "..."
-                    message = f"{script_name} failed: {error_msg}"
-                else:
-                    message = f"{script_name} failed with exit code {exit_code}"
+                title, template = _TEMPLATES['error_code']
+                message = template.format(name=script_name, code=exit_code)
 
                 self.notification_manager.show_notification(title, message, 'error')
                 self.logger.debug(f"Showed script error notification for: {script_name}")
 
-        except Exception as e:
-            self.logger.error(f"Error showing script error notification: {e}")
-
-    def on_script_stopped(self, data: Dict[str, Any]):
-        """Handle script stopped event"""
-        try:
-            reason = data.get('reason', 'unknown')
+    @_safe("showing script error notification")
+    def on_script_error(self, data: Dict[str, Any]):
+        """Handle script error event"""
+        if self.should_show_notification('script_error'):
             script_name = self.format_script_name(data.get('script_name', 'Script'))
-
-            if reason == 'user_request':
-                # User manually stopped - show warning notification
-                if self.should_show_notification('script_warning'):
-                    title = "Script Stopped"
-                    message = f"{script_name} was stopped by user"
-
-                    self.notification_manager.show_notification(title, message, 'warning')
-                    self.logger.debug(f"Showed script stopped notification for: {script_name}")
+            exit_code = data.get('exit_code', 'Unknown')
+            error_msg = data.get('error', '')
+
+            # Create informative message
+            if error_msg:
+                # Truncate long error messages for notification
+                if len(error_msg) > 100:
+                    error_msg = error_msg[:97] + "..."
+                title, template = _TEMPLATES['error_message']
+                message = template.format(name=script_name, error=error_msg)
             else:
-                # Script stopped due to error - treat as error
-                if self.should_show_notification('script_error'):
-                    title = "Script Terminated"
-                    message = f"{script_name} was terminated unexpectedly"
+                title, template = _TEMPLATES['error_exit']
+                message = template.format(name=script_name, code=exit_code)
 
-                    self.notification_manager.show_notification(title, message, 'error')
-                    self.logger.debug(f"Showed script termination notification for: {script_name}")
+            self.notification_manager.show_notification(title, message, 'error')
+            self.logger.debug(f"Showed script error notification for: {script_name}")
 
-        except Exception as e:
-            self.logger.error(f"Error showing script stopped notification: {e}")
+    @_safe("showing script stopped notification")
+    def on_script_stopped(self, data: Dict[str, Any]):
+        """Handle script stopped event"""
+        reason = data.get('reason', 'unknown')
+        script_name = self.format_script_name(data.get('script_name', 'Script'))
+
+        if reason == 'user_request':
+            # User manually stopped - show warning notification
+            if self.should_show_notification('script_warning'):
+                title, template = _TEMPLATES['stopped']
+                message = template.format(name=script_name)
+
+                self.notification_manager.show_notification(title, message, 'warning')
+                self.logger.debug(f"Showed script stopped notification for: {script_name}")
+        else:
+            # Script stopped due to error - treat as error
+            if self.should_show_notification('script_error'):
+                title, template = _TEMPLATES['terminated']
+                message = template.format(name=script_name)
+
+                self.notification_manager.show_notification(title, message, 'error')
+                self.logger.debug(f"Showed script termination notification for: {script_name}")
 
+    @_safe("updating notification settings")
     def on_settings_changed(self, data: Dict[str, Any]):
         """Handle settings change event"""
-        try:
-            settings = data.get('settings', {})
-
-            # Update notification manager settings
-            if 'notifications_enabled' in settings:
-                self.notification_manager.set_enabled(settings['notifications_enabled'])
+        settings = data.get('settings', {})
 
-            if 'notification_duration' in settings:
-                self.notification_manager.set_duration(settings['notification_duration'])
+        # Update notification manager settings
+        if 'notifications_enabled' in settings:
+            self.set_notifications_enabled(settings['notifications_enabled'])
 
-            # NEW: Handle silent notifications setting
-            if 'silent_notifications' in settings:
-                self.notification_manager.set_silent(settings['silent_notifications'])
+        if 'notification_duration' in settings:
+            self.notification_manager.set_duration(settings['notification_duration'])
 
-            self.logger.debug("Updated notification settings from settings change")
+        # NEW: Handle silent notifications setting
+        if 'silent_notifications' in settings:
+            self.notification_manager.set_silent(settings['silent_notifications'])
 
-        except Exception as e:
-            self.logger.error(f"Error updating notification settings: {e}")
+        self.logger.debug("Updated notification settings from settings change")
 
+    @_safe("handling state change for notifications")
     def on_state_changed(self, data: Dict[str, Any]):
         """Handle individual state changes"""
-        try:
-            key = data.get('key')
-            value = data.get('value')
-
-            if key == 'notifications_enabled':
-                self.notification_manager.set_enabled(value)
-            elif key == 'notification_duration':
-                self.notification_manager.set_duration(value)
-            elif key == 'silent_notifications':  # NEW
-                self.notification_manager.set_silent(value)
-
-        except Exception as e:
-            self.logger.error(f"Error handling state change for notifications: {e}")
+        # Most state changes are unrelated to notifications and stop here
+        handler = self._state_handlers.get(data.get('key'))
+        if handler is not None:
+            handler(data.get('value'))
 
     def show_test_notification(self, notification_type: str = 'info'):
         """Show a test notification of the specified type"""
         self.notification_manager.test_notification(notification_type)
 
     def test_integration(self):
-        """Test the notification integration by simulating events"""
-        self.logger.info("Testing notification integration...")
+        """Test the notification integration by simulating events
 
-        # Test script start
-        self.on_script_started({'script_name': 'test_script.py'})
-
-        # Wait a bit then test success
-        import time
-        time.sleep(2)
-        self.on_script_completed({
-            'status': 'success',
-            'exit_code': 0,
-            'script_name': 'test_script.py'
-        })
-
-        # Wait a bit then test error
-        time.sleep(2)
-        self.on_script_error({
-            'exit_code': 1,
-            'error': 'Test error message',
-            'script_name': 'test_script.py'
-        })
+        Returns immediately; the simulated events are fired from timers so
+        the calling (usually UI) thread is not blocked.
+        """
+        self.logger.info("Testing notification integration...")
 
-        self.logger.info("Notification integration test complete")
+        steps = [
+            # Test script start
+            (self.on_script_started, {'script_name': 'test_script.py'}),
+            # Then test success
+            (self.on_script_completed, {
+                'status': 'success',
+                'exit_code': 0,
+                'script_name': 'test_script.py'
+            }),
+            # Then test error
+            (self.on_script_error, {
+                'exit_code': 1,
+                'error': 'Test error message',
+                'script_name': 'test_script.py'
+            }),
+        ]
+
+        for index, (handler, data) in enumerate(steps):
+            timer = threading.Timer(index * TEST_NOTIFICATION_INTERVAL, handler, args=(data,))
+            timer.daemon = True
+            timer.start()
+
+        self.logger.info("Notification integration test scheduled")
 
     def cleanup(self):
         """Clean up resources"""
         try:
             # Unsubscribe from events
-            self.event_bus.unsubscribe(Events.SCRIPT_STARTED, self.on_script_started)
-            self.event_bus.unsubscribe(Events.SCRIPT_COMPLETED, self.on_script_completed)
-            self.event_bus.unsubscribe(Events.SCRIPT_ERROR, self.on_script_error)
-            self.event_bus.unsubscribe(Events.SCRIPT_STOPPED, self.on_script_stopped)
-            self.event_bus.unsubscribe('settings.saved', self.on_settings_changed)
-            self.event_bus.unsubscribe('state.changed', self.on_state_changed)
+            self.event_bus.unsubscribe_many(self._settings_event_subscriptions())
+            self.unsubscribe_script_events()
 
             # Clean up notification manager
             self.notification_manager.cleanup()
@@ -5,18 +5,123 @@ Save this as: services/notification_manager.py
 
 import os
 import sys
+import functools
+import importlib.util
 import logging
+import queue
+import shutil
 import subprocess
+import threading
+import time
 from typing import Dict, Optional
 from pathlib import Path
 
-# Try to import plyer for cross-platform notifications
-try:
-    from plyer import notification as plyer_notification
-
-    PLYER_AVAILABLE = True
-except ImportError:
-    PLYER_AVAILABLE = False
+# Check for plyer (cross-platform notifications) without importing it; plyer
+# pulls in a large module graph, so it is only imported for the first notification
+PLYER_AVAILABLE = importlib.util.find_spec('plyer') is not None
+
+# Pending notifications kept while the worker is busy; the oldest is dropped beyond this
+NOTIFICATION_QUEUE_SIZE = 64
+
+# Identical (title, type) notifications within this many seconds are shown once
+NOTIFICATION_DEBOUNCE_SECONDS = 0.25
+
+# Seconds between notifications fired by the test helpers
+TEST_NOTIFICATION_INTERVAL = 2.0
+
+# Access right needed to check whether the input desktop can be switched to
+DESKTOP_SWITCHDESKTOP = 0x0100
+
+
+def _osa_escape(text: str) -> str:
+    """Escape text for use inside an AppleScript string literal
+
+    Newlines are escaped too, since the osascript interpreter reads one
+    command per line.
+    """
+    return (text.replace('\\', '\\\\')
+            .replace('"', '\\"')
+            .replace('\r', '\\r')
+            .replace('\n', '\\n'))
+
+
+@functools.lru_cache(maxsize=1)
+def _find_app_icon() -> Optional[str]:
+    """Get the path to the application icon
+
+    The icon does not move while the app runs, so the lookup is done once
+    per process rather than for every NotificationManager.
+    """
+    # Try to find the icon in the assets folder
+    possible_paths = [
+        # "assets/icons/kodiak.png",
+        "assets/icons/kodiak.ico",
+        "assets/icons/app.png",
+        "assets/icons/icon.png",
+        "icon.png"
+    ]
+
+    for path in possible_paths:
+        if os.path.exists(path):
+            return os.path.abspath(path)
+
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_backend() -> str:
+    """Detect the best notification backend for the current platform
+
+    Checks what is installed without running it, and only once per process.
+    """
+    if PLYER_AVAILABLE:
+        return 'plyer'
+
+    if sys.platform.startswith('win'):
+        if importlib.util.find_spec('win10toast') is not None:
+            return 'win10toast'
+        return 'windows_fallback'
+    elif sys.platform.startswith('darwin'):
+        # osascript should be on all macOS systems
+        if shutil.which('osascript'):
+            return 'osascript'
+        return 'macos_fallback'
+    else:
+        # Linux and other Unix-like systems
+        if shutil.which('notify-send'):
+            return 'notify-send'
+        return 'linux_fallback'
+
+
+def _is_session_locked() -> bool:
+    """Best-effort check for a locked workstation
+
+    Windows only: while the lock screen is up the input desktop is Winlogon's
+    secure desktop, which this process can neither open nor switch to.
+    Other platforms always report unlocked.
+    """
+    if not sys.platform.startswith('win'):
+        return False
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        user32.OpenInputDesktop.restype = wintypes.HANDLE
+        user32.OpenInputDesktop.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+        user32.SwitchDesktop.argtypes = (wintypes.HANDLE,)
+        user32.CloseDesktop.argtypes = (wintypes.HANDLE,)
+
+        desktop = user32.OpenInputDesktop(0, False, DESKTOP_SWITCHDESKTOP)
+        if not desktop:
+            return True
+        try:
+            # Switching to the desktop that already has input is a no-op
+            return not user32.SwitchDesktop(desktop)
+        finally:
+            user32.CloseDesktop(desktop)
+    except Exception:
+        return False
 
 
 class NotificationManager:
@@ -31,58 +136,33 @@ class NotificationManager:
 
         # App info
         self.app_name = "AutoBear Script Runner"
-        self.app_icon = self._get_app_icon_path()
+        self.app_icon = _find_app_icon()
+
+        # Backend modules, imported on first use
+        self._plyer_notification = None
+        self._toaster = None
+
+        # Long-lived `osascript -i` interpreter, started on first use
+        self._osascript_process: Optional[subprocess.Popen] = None
 
         # Determine the best notification method for this platform
-        self.notification_backend = self._detect_notification_backend()
+        self.notification_backend = _detect_backend()
 
-        self.logger.info(f"Notification manager initialized with backend: {self.notification_backend}")
-        self.logger.info(f"Silent notifications: {self.silent_notifications}")
+        # Backends spawn processes or block on the OS, so notifications are
+        # shown from a worker thread instead of the caller's thread
+        self._notification_queue = queue.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+        self._worker_thread = threading.Thread(
+            target=self._notification_worker,
+            name="NotificationWorker",
+            daemon=True
+        )
+        self._worker_thread.start()
 
-    def _detect_notification_backend(self) -> str:
-        """Detect the best notification backend for the current platform"""
-        if PLYER_AVAILABLE:
-            return 'plyer'
+        # (title, notification_type) -> monotonic time it was last queued
+        self._last_shown: Dict[tuple, float] = {}
 
-        if sys.platform.startswith('win'):
-            try:
-                import win10toast
-                return 'win10toast'
-            except ImportError:
-                return 'windows_fallback'
-        elif sys.platform.startswith('darwin'):
-            # Check if osascript is available (should be on all macOS systems)
-            try:
-                subprocess.run(['osascript', '-e', 'display notification "test"'],
-                               capture_output=True, check=True)
-                return 'osascript'
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                return 'macos_fallback'
-        else:
-            # Linux and other Unix-like systems
-            try:
-                subprocess.run(['notify-send', '--version'],
-                               capture_output=True, check=True)
-                return 'notify-send'
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                return 'linux_fallback'
-
-    def _get_app_icon_path(self) -> Optional[str]:
-        """Get the path to the application icon"""
-        # Try to find the icon in the assets folder
-        possible_paths = [
-            # "assets/icons/kodiak.png",
-            "assets/icons/kodiak.ico",
-            "assets/icons/app.png",
-            "assets/icons/icon.png",
-            "icon.png"
-        ]
-
-        for path in possible_paths:
-            if os.path.exists(path):
-                return os.path.abspath(path)
-
-        return None
+        self.logger.info(f"Notification manager initialized with backend: {self.notification_backend}")
+        self.logger.info(f"Silent notifications: {self.silent_notifications}")
 
     def set_enabled(self, enabled: bool):
         """Enable or disable system notifications"""
@@ -109,7 +189,7 @@ class NotificationManager:
         }
 
     def show_notification(self, title: str, message: str, notification_type: str = 'info'):
-        """Show a system notification
+        """Queue a system notification for the worker thread
 
         Args:
             title: Notification title
@@ -119,6 +199,42 @@ class NotificationManager:
         if not self.notifications_enabled:
             return
 
+        # Nobody will see a toast on the lock screen; errors are still shown
+        if notification_type != 'error' and _is_session_locked():
+            self.logger.debug(f"Session locked, skipped notification: {title}")
+            return
+
+        # Coalesce bursts of the same notification into one
+        key = (title, notification_type)
+        now = time.monotonic()
+        if now - self._last_shown.get(key, float('-inf')) < NOTIFICATION_DEBOUNCE_SECONDS:
+            return
+        self._last_shown[key] = now
+
+        job = (title, message, notification_type)
+        try:
+            self._notification_queue.put_nowait(job)
+        except queue.Full:
+            # Drop the oldest pending notification rather than block the caller
+            try:
+                self._notification_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._notification_queue.put_nowait(job)
+            except queue.Full:
+                self.logger.warning(f"Notification queue full, dropped: {title}")
+
+    def _notification_worker(self):
+        """Show queued notifications one at a time until cleanup"""
+        while True:
+            job = self._notification_queue.get()
+            if job is None:
+                break
+            self._dispatch_notification(*job)
+
+    def _dispatch_notification(self, title: str, message: str, notification_type: str):
+        """Show a notification with the detected backend"""
         try:
             # Choose appropriate icon based on type
             icon_path = self._get_notification_icon(notification_type)
@@ -149,9 +265,13 @@ class NotificationManager:
     def _show_plyer_notification(self, title: str, message: str, icon_path: Optional[str]):
         """Show notification using plyer library"""
         try:
+            if self._plyer_notification is None:
+                from plyer import notification as plyer_notification
+                self._plyer_notification = plyer_notification
+
             # Note: plyer doesn't have a direct way to disable sound
             # The system will handle sound based on OS settings
-            plyer_notification.notify(
+            self._plyer_notification.notify(
                 title=title,
                 message=message,
                 app_name=self.app_name,
@@ -165,17 +285,19 @@ class NotificationManager:
     def _show_win10toast_notification(self, title: str, message: str, icon_path: Optional[str]):
         """Show notification using win10toast library"""
         try:
-            import win10toast
-            toaster = win10toast.ToastNotifier()
+            if self._toaster is None:
+                import win10toast
+                self._toaster = win10toast.ToastNotifier()
 
-            # win10toast doesn't have a direct silent option, but we can try to minimize sound
-            # by using threaded=True which might reduce OS sound integration
-            toaster.show_toast(
+            # Already on the notification worker thread, so show the toast
+            # synchronously; a shared ToastNotifier drops a threaded toast
+            # while the previous one is still up, this queues it instead
+            self._toaster.show_toast(
                 title,
                 message,
                 icon_path=icon_path,
                 duration=self.notification_duration,
-                threaded=True
+                threaded=False
             )
         except Exception as e:
             self.logger.error(f"Win10toast notification error: {e}")
@@ -184,17 +306,43 @@ class NotificationManager:
     def _show_osascript_notification(self, title: str, message: str):
         """Show notification using macOS osascript"""
         try:
+            title = _osa_escape(title)
+            message = _osa_escape(message)
+
             # MODIFIED: Remove sound when silent_notifications is True
             if self.silent_notifications:
                 script = f'display notification "{message}" with title "{title}"'
             else:
                 script = f'display notification "{message}" with title "{title}" sound name "Default"'
 
-            subprocess.run(['osascript', '-e', script], check=True)
+            process = self._get_osascript_process()
+            try:
+                process.stdin.write(script + '\n')
+                process.stdin.flush()
+            except (BrokenPipeError, OSError):
+                # The interpreter went away; start a new one next time
+                self._osascript_process = None
+                raise
         except Exception as e:
             self.logger.error(f"osascript notification error: {e}")
             raise
 
+    def _get_osascript_process(self) -> subprocess.Popen:
+        """Return the running osascript interpreter, starting it if needed
+
+        Each notification is then a write to its stdin instead of a new
+        osascript process.
+        """
+        if self._osascript_process is None or self._osascript_process.poll() is not None:
+            self._osascript_process = subprocess.Popen(
+                ['osascript', '-i'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+        return self._osascript_process
+
     def _show_notify_send_notification(self, title: str, message: str,
                                        notification_type: str, icon_path: Optional[str]):
         """Show notification using Linux notify-send"""
@@ -278,18 +426,39 @@ class NotificationManager:
         self.show_notification(title, message, notification_type)
 
     def test_all_notifications(self):
-        """Test all notification types with delay between them"""
-        import time
+        """Test all notification types with delay between them
 
-        for notif_type in self.get_available_types().keys():
-            self.logger.info(f"Testing {notif_type} notification...")
-            self.test_notification(notif_type)
-            time.sleep(2)  # Brief pause between notifications
+        Returns immediately; the notifications are fired from timers so
+        the calling (usually UI) thread is not blocked.
+        """
+        for index, notif_type in enumerate(self.get_available_types().keys()):
+            timer = threading.Timer(index * TEST_NOTIFICATION_INTERVAL,
+                                    self._run_test_notification, args=(notif_type,))
+            timer.daemon = True
+            timer.start()
+
+    def _run_test_notification(self, notification_type: str):
+        """Fire one scheduled test notification"""
+        self.logger.info(f"Testing {notification_type} notification...")
+        self.test_notification(notification_type)
 
     def cleanup(self):
         """Clean up notification resources"""
-        # Most notification systems don't require explicit cleanup
-        # But this method is here for consistency with other managers
+        # Let the worker finish what is already queued, then exit
+        try:
+            self._notification_queue.put_nowait(None)
+        except queue.Full:
+            pass  # The worker is a daemon thread and ends with the app
+
+        # Send EOF to the osascript interpreter so it exits
+        process = self._osascript_process
+        self._osascript_process = None
+        if process is not None and process.poll() is None:
+            try:
+                process.stdin.close()
+                process.wait(timeout=2)
+            except Exception:
+                process.kill()
         self.logger.info("Notification manager cleaned up")
 
 
@@ -1,7 +1,7 @@
 """Output manager service for handling script output display"""
 
-from typing import Callable, Optional
-from config.settings import OUTPUT_CHECK_INTERVAL
+from typing import Callable, List, Optional, Tuple
+from config.settings import OUTPUT_CHECK_INTERVAL, OUTPUT_CHECK_MIN_INTERVAL, OUTPUT_CHECK_MAX_INTERVAL
 
 
 class OutputManager:
@@ -17,20 +17,28 @@ class OutputManager:
         self.app = app_instance
         self.script_runner = script_runner
         self.output_callback: Optional[Callable] = None
+        self.output_batch_callback: Optional[Callable] = None
         self._check_scheduled = False
+        self._check_interval = OUTPUT_CHECK_INTERVAL
 
-    def set_output_callback(self, callback: Callable[[str, str], None]):
+    def set_output_callback(self, callback: Callable[[str, str], None],
+                            batch_callback: Optional[Callable[[List[Tuple[str, str]]], None]] = None):
         """Set the callback function for displaying output
 
         Args:
-            callback: Function that takes (message_type, message) as arguments
+            callback: Function that takes (message, message_type) as arguments
+            batch_callback: Optional function that takes every pending
+                (message_type, message) pair at once; used instead of
+                callback when set
         """
         self.output_callback = callback
+        self.output_batch_callback = batch_callback
 
     def start_monitoring(self):
         """Start monitoring the script output"""
         if not self._check_scheduled:
             self._check_scheduled = True
+            self._check_interval = OUTPUT_CHECK_INTERVAL
             self._check_output()
 
     def stop_monitoring(self):
@@ -38,8 +46,18 @@ class OutputManager:
         self._check_scheduled = False
 
     def _check_output(self):
-        """Check for new output messages from the script"""
-        if self.output_callback:
+        """Check for new output messages from the script
+
+        Polls quickly while the script is producing output and backs off
+        (doubling up to OUTPUT_CHECK_MAX_INTERVAL) while it is quiet.
+        """
+        messages = []
+        if self.output_batch_callback:
+            # Hand every pending message to the console in one call
+            messages = self.script_runner.get_all_output()
+            if messages:
+                self.output_batch_callback(messages)
+        elif self.output_callback:
             # Get all pending messages
             messages = self.script_runner.get_all_output()
 
@@ -48,6 +66,11 @@ class OutputManager:
                 # The console expects (message, msg_type) not (msg_type, message)
                 self.output_callback(message, msg_type)
 
+        if messages:
+            self._check_interval = OUTPUT_CHECK_MIN_INTERVAL
+        else:
+            self._check_interval = min(self._check_interval * 2, OUTPUT_CHECK_MAX_INTERVAL)
+
         # Schedule next check if still monitoring
         if self._check_scheduled:
-            self.app.after(OUTPUT_CHECK_INTERVAL, self._check_output)
+            self.app.after(self._check_interval, self._check_output)
@@ -2,10 +2,10 @@
 
 import threading
 import time
-import queue
 import subprocess
 import sys
 import os
+from collections import deque
 from typing import Callable, Optional, List, Tuple
 from config.settings import SIMULATION_OPERATIONS, SCRIPT_SIMULATION_DELAY
 
@@ -27,7 +27,9 @@ class ScriptRunner:
         self.is_running = False
         self.current_thread: Optional[threading.Thread] = None
         self.current_process: Optional[subprocess.Popen] = None
-        self.output_queue = queue.Queue()
+        # deque.append/popleft are atomic, so the script thread and the UI
+        # poll can share it without the locking queue.Queue does
+        self.output_queue = deque()
         self._stop_requested = False
         self.developer_mode = False  # Track developer mode
         self.last_exit_code = None  # Track the exit code of the last script
@@ -126,8 +128,8 @@ class ScriptRunner:
             Tuple of (message_type, message) or None if queue is empty
         """
         try:
-            return self.output_queue.get_nowait()
-        except queue.Empty:
+            return self.output_queue.popleft()
+        except IndexError:
             return None
 
     def get_all_output(self) -> List[Tuple[str, str]]:
@@ -136,21 +138,20 @@ class ScriptRunner:
         Returns:
             List of (message_type, message) tuples
         """
+        # Pop one at a time; copying then clearing could lose messages the
+        # script thread appends in between
         messages = []
-        while True:
-            msg = self.get_output()
-            if msg is None:
-                break
-            messages.append(msg)
+        popleft = self.output_queue.popleft
+        try:
+            while True:
+                messages.append(popleft())
+        except IndexError:
+            pass
         return messages
 
     def clear_output_queue(self):
         """Clear any pending output messages"""
-        while not self.output_queue.empty():
-            try:
-                self.output_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.output_queue.clear()
 
     def set_developer_mode(self, enabled: bool):
         """Update developer mode setting"""
@@ -269,7 +270,7 @@ class ScriptRunner:
                 self._add_output(LogLevel.SYSTEM, "Script paused for user review")
 
                 # Try to load pause state if it exists
-                state_file = os.path.join(os.path.dirname(script_path), ".divvy_state.pkl")
+                state_file = os.path.join(os.path.dirname(script_path), ".divvy_state.json")
                 if os.path.exists(state_file):
                     self.pause_state = state_file
             else:
@@ -297,7 +298,7 @@ class ScriptRunner:
             msg_type: Type of message (debug, info, success, warning, error)
             message: The message content
         """
-        self.output_queue.put((msg_type, message))
+        self.output_queue.append((msg_type, message))
 
     def is_script_paused(self) -> bool:
         """Check if the script is currently paused"""
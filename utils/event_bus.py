@@ -1,6 +1,6 @@
 """Event system for component communication using publish/subscribe pattern"""
 
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, List, Callable, Any, Optional, Iterable, Tuple
 import logging
 
 
@@ -51,6 +51,30 @@ class EventBus:
         
         return False
     
+    def subscribe_many(self, subscriptions: Iterable[Tuple[str, Callable[[Any], None]]]) -> None:
+        """Register several (event_name, callback) pairs in one call
+        
+        Args:
+            subscriptions: Iterable of (event_name, callback) pairs
+        """
+        for event_name, callback in subscriptions:
+            self.subscribe(event_name, callback)
+    
+    def unsubscribe_many(self, subscriptions: Iterable[Tuple[str, Callable[[Any], None]]]) -> int:
+        """Remove several (event_name, callback) pairs in one call
+        
+        Args:
+            subscriptions: Iterable of (event_name, callback) pairs
+            
+        Returns:
+            Number of callbacks that were found and removed
+        """
+        removed = 0
+        for event_name, callback in subscriptions:
+            if self.unsubscribe(event_name, callback):
+                removed += 1
+        return removed
+    
     def publish(self, event_name: str, data: Any = None) -> None:
         """Publish an event to all subscribers
         
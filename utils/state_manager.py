@@ -5,6 +5,14 @@ import logging
 from copy import deepcopy
 from .event_bus import get_event_bus, Events
 
+# Try to import orjson for faster settings (de)serialization
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class StateManager:
     """Centralized state management with observer pattern support"""
@@ -308,9 +316,13 @@ class StateManager:
             # Ensure directory exists
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
-            # Save state to file
-            with open(filepath, 'w') as f:
-                json.dump(self._state, f, indent=2)
+            # Save state to file (orjson writes bytes directly when available)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(self._state, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(self._state, f, indent=2)
 
             self._logger.info(f"Settings saved to {filepath}")
             return True
@@ -335,8 +347,12 @@ class StateManager:
                 self._logger.info(f"Settings file {filepath} not found, using defaults")
                 return False
 
-            with open(filepath, 'r') as f:
-                loaded_state = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'rb') as f:
+                    loaded_state = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r') as f:
+                    loaded_state = json.load(f)
 
             # Update current state with loaded values
             self._state.update(loaded_state)